@@ -1,3 +1,4 @@
+from .http_client import HTTPClient
 from .base_fetcher import BaseFetcher
 from .news_api_fetcher import NewsAPIFetcher
 from .google_news_fetcher import GoogleNewsFetcher
@@ -7,6 +8,7 @@ from .medium_fetcher import MediumFetcher
 from .devto_fetcher import DevToFetcher
 
 __all__ = [
+    'HTTPClient',
     'BaseFetcher',
     'NewsAPIFetcher',
     'GoogleNewsFetcher',
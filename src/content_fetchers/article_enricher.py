@@ -0,0 +1,148 @@
+import logging
+import re
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from bs4 import SoupStrainer
+from .html_parser import parse_html, resolve_parser
+from .http_client import HTTPClient
+from .structured_data import extract_structured_data
+
+# Paragraph text is all the body extraction needs
+BODY_STRAINER = SoupStrainer(['p'])
+
+# Paragraphs shorter than this are usually captions, bylines or share links
+MIN_PARAGRAPH_CHARS = 40
+
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def extract_body(html_content, url: str, parser: str = 'lxml') -> str:
+    """
+    Extract the main text of an article page.
+
+    A JSON-LD ``articleBody`` is used when the page has one; otherwise the
+    page's substantial paragraphs are joined.
+    """
+    data = extract_structured_data(html_content, url, parser)
+    for article in data['articles']:
+        if article['url'].rstrip('/') == url.rstrip('/') and len(article['content']) > len(article['summary']):
+            return article['content']
+
+    soup = parse_html(html_content, parser, BODY_STRAINER)
+    paragraphs = (_WHITESPACE_PATTERN.sub(' ', p.get_text()).strip() for p in soup.find_all('p'))
+    return ' '.join(text for text in paragraphs if len(text) >= MIN_PARAGRAPH_CHARS)
+
+
+class BodyCache:
+    """Persistent store of extracted article bodies per URL."""
+
+    def __init__(self, db_path: str = "http_cache.db"):
+        self.logger = logging.getLogger(__name__)
+        self.db_path = db_path
+        self._init_db()
+
+    def _init_db(self):
+        """Initialize the database with required tables."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS article_bodies (
+                        url TEXT PRIMARY KEY,
+                        body TEXT,
+                        fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                conn.commit()
+        except Exception as e:
+            self.logger.error(f"Error initializing body cache: {str(e)}")
+            raise
+
+    def get_many(self, urls: List[str]) -> Dict[str, str]:
+        """Get the cached bodies for several URLs in one query."""
+        if not urls:
+            return {}
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                placeholders = ','.join('?' * len(urls))
+                cursor.execute(f"SELECT url, body FROM article_bodies WHERE url IN ({placeholders})", urls)
+                return dict(cursor.fetchall())
+        except Exception as e:
+            self.logger.error(f"Error reading body cache: {str(e)}")
+            return {}
+
+    def store(self, url: str, body: str):
+        """Store the body extracted for a URL."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "INSERT OR REPLACE INTO article_bodies (url, body, fetched_at) VALUES (?, ?, datetime('now'))",
+                    (url, body)
+                )
+                conn.commit()
+        except Exception as e:
+            self.logger.error(f"Error writing body cache for {url}: {str(e)}")
+
+
+class ArticleEnricher:
+    """
+    Fills in the full text of a few candidate articles.
+
+    Fetcher content is often a truncated snippet, so the finalists of the
+    first scoring pass get their pages downloaded, with bounded concurrency,
+    and their bodies extracted. Bodies are cached per URL so a candidate
+    seen again on a later run is not downloaded again.
+    """
+
+    def __init__(self, config: Optional[Dict] = None, http_client: Optional[HTTPClient] = None):
+        self.logger = logging.getLogger(__name__)
+        config = config or {}
+        self.http_client = http_client or HTTPClient.shared()
+        self.max_concurrency = max(1, config.get('max_concurrency', 4))
+        self.min_content_chars = config.get('min_content_chars', 1000)  # Content this long is left as is
+        self.max_body_chars = config.get('max_body_chars', 20000)
+        self.parser = resolve_parser(config.get('parser', 'lxml'))
+        self.cache = BodyCache(config.get('cache_path', 'http_cache.db'))
+
+    def _fetch_body(self, url: str) -> str:
+        """Download an article page and extract its body."""
+        try:
+            response = self.http_client.get(url)
+            response.raise_for_status()
+            return extract_body(response.content, url, self.parser)[:self.max_body_chars]
+        except Exception as e:
+            self.logger.error(f"Error fetching article body for {url}: {str(e)}")
+            return ''
+
+    def enrich(self, articles: List[Dict]) -> List[Dict]:
+        """Replace short article content with the full body, in place."""
+        pending = [
+            article for article in articles
+            if article.get('url') and len(article.get('content') or '') < self.min_content_chars
+        ]
+        if not pending:
+            return articles
+
+        urls = list(dict.fromkeys(article['url'] for article in pending))
+        bodies = self.cache.get_many(urls)
+        missing = [url for url in urls if url not in bodies]
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(missing))) as executor:
+                for url, body in zip(missing, executor.map(self._fetch_body, missing)):
+                    bodies[url] = body
+                    if body:
+                        self.cache.store(url, body)
+
+        enriched = 0
+        for article in pending:
+            body = bodies.get(article['url']) or ''
+            if len(body) > len(article.get('content') or ''):
+                article['content'] = body
+                enriched += 1
+
+        self.logger.info(f"Enriched {enriched} of {len(pending)} articles ({len(missing)} downloaded)")
+        return articles
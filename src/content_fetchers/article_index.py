@@ -0,0 +1,49 @@
+from typing import Dict, Iterator, List, Optional, Tuple
+from .url_canonicalizer import canonical_url
+
+
+def canonical_url_key(url: str) -> str:
+    """Canonical form of a URL for in-fetcher deduplication."""
+    return canonical_url(url) if url else ''
+
+
+class ArticleIndex:
+    """
+    Insertion-ordered index of raw articles keyed by a canonical id.
+
+    When the same article comes back under several topics or tags, the first
+    copy is kept and the other topic labels are merged onto it, so each
+    article is formatted and scored only once.
+    """
+
+    def __init__(self):
+        self.records = {}
+        self.duplicates = 0
+
+    def add(self, key: str, raw_article: Dict, topic: str) -> Optional[List[str]]:
+        """
+        Add an article under a topic.
+
+        Returns the article's topic list, which later duplicates extend, or
+        None if it was a duplicate.
+        """
+        if not key:
+            key = f"unkeyed:{len(self.records)}"
+
+        if key in self.records:
+            topics = self.records[key][1]
+            if topic not in topics:
+                topics.append(topic)
+            self.duplicates += 1
+            return None
+
+        topics = [topic]
+        self.records[key] = (raw_article, topics)
+        return topics
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def items(self) -> Iterator[Tuple[Dict, List[str]]]:
+        """Yield ``(raw_article, topics)`` in first-seen order."""
+        yield from self.records.values()
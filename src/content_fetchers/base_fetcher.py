@@ -1,13 +1,17 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import List, Dict, Optional, Iterator, AsyncIterator
+import asyncio
 import logging
+from .http_client import HTTPClient
 
 class BaseFetcher(ABC):
     """Base class for all content fetchers."""
     
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, http_client: Optional[HTTPClient] = None):
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
+        # Shared transport so all fetchers reuse pooled keep-alive connections
+        self.http_client = http_client or HTTPClient.shared()
     
     @abstractmethod
     def fetch_articles(self) -> List[Dict]:
@@ -25,11 +29,36 @@ class BaseFetcher(ABC):
                 'date': str,
                 'topic': str,
                 'topic_hashtag': str,
+                'topics': List[str],
                 'relevance_score': float
             }
         """
         pass
     
+    def iter_articles(self) -> Iterator[Dict]:
+        """
+        Yield articles as they are fetched.
+        
+        Fetchers that make several requests override this so downstream
+        processing can start before the last request finishes. The default
+        falls back to ``fetch_articles``.
+        """
+        yield from self.fetch_articles()
+    
+    def close(self):
+        """Release resources held across runs, such as worker pools."""
+        pass
+    
+    async def aiter_articles(self) -> AsyncIterator[Dict]:
+        """Async variant of ``iter_articles`` that runs the fetcher off the event loop."""
+        iterator = self.iter_articles()
+        done = object()
+        while True:
+            article = await asyncio.to_thread(next, iterator, done)
+            if article is done:
+                break
+            yield article
+    
     def format_article(self, raw_article: Dict, source: str) -> Dict:
         """Format raw article data into standardized format."""
         return {
@@ -41,5 +70,6 @@ class BaseFetcher(ABC):
             'date': raw_article.get('date', raw_article.get('publishedAt', '')),
             'topic': raw_article.get('topic', 'artificial intelligence'),
             'topic_hashtag': raw_article.get('topic_hashtag', 'AI'),
+            'topics': raw_article.get('topics', [raw_article.get('topic', 'artificial intelligence')]),
             'relevance_score': raw_article.get('relevance_score', 0.8)
         }
@@ -0,0 +1,90 @@
+from typing import Dict, List, Optional
+
+from .keyword_matcher import KeywordMatcher
+
+# Batch scoring builds sparse term matrices; without NumPy/SciPy articles are scored one at a time
+try:
+    import numpy as np
+    from scipy import sparse
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+DEFAULT_FIELD_WEIGHTS = {'title': 2.0, 'summary': 1.0, 'content': 0.5}
+
+
+class BM25Scorer:
+    """
+    Field-weighted BM25 (BM25F) of articles against a fixed keyword list.
+
+    Each field of the candidate set is tokenized once into a sparse
+    article-by-keyword count matrix. Counts are length-normalized per field,
+    weighted and summed, then saturated and weighted by keyword IDF across
+    the batch in a few vectorized operations. Unlike the flat capped score,
+    repeated and rare keywords keep separating articles, so far fewer tie.
+    """
+
+    def __init__(self, keyword_matcher: KeywordMatcher, field_weights: Optional[Dict[str, float]] = None,
+                 k1: float = 1.2, b: float = 0.75):
+        self.matcher = keyword_matcher
+        self.columns = {keyword: column for column, keyword in enumerate(keyword_matcher.keywords)}
+        self.field_weights = dict(field_weights or DEFAULT_FIELD_WEIGHTS)
+        self.k1 = k1
+        self.b = b
+
+        # Collection statistics of the last scored batch, reused by ``score``
+        self.idf = None
+        self.average_lengths = {}
+
+    def _field_matrix(self, articles: List[Dict], field: str):
+        """Keyword counts and token lengths of one field across the articles."""
+        rows, columns, counts = [], [], []
+        lengths = np.zeros(len(articles))
+        for row, article in enumerate(articles):
+            text = article.get(field) or ''
+            lengths[row] = len(text.split())
+            for keyword, count in self.matcher.count(text).items():
+                rows.append(row)
+                columns.append(self.columns[keyword])
+                counts.append(count)
+        matrix = sparse.csr_matrix(
+            (np.array(counts, dtype=float), (rows, columns)),
+            shape=(len(articles), len(self.columns))
+        )
+        return matrix, lengths
+
+    def score_batch(self, articles: List[Dict]) -> List[float]:
+        """Score a candidate set, taking IDF and average field lengths from it."""
+        if not articles or not self.columns:
+            return [0.0] * len(articles)
+
+        fields = {field: self._field_matrix(articles, field) for field in self.field_weights}
+
+        # An article contains a keyword if any field does
+        present = sum((matrix > 0).astype(float) for matrix, _ in fields.values())
+        document_frequency = np.asarray((present > 0).sum(axis=0)).ravel()
+        total = len(articles)
+        self.idf = np.log1p((total - document_frequency + 0.5) / (document_frequency + 0.5))
+        self.average_lengths = {field: max(lengths.mean(), 1.0) for field, (_, lengths) in fields.items()}
+
+        return self._score_fields(fields)
+
+    def score(self, articles: List[Dict]) -> List[float]:
+        """Score articles against the statistics of the last scored batch."""
+        if self.idf is None:
+            return self.score_batch(articles)
+        if not articles or not self.columns:
+            return [0.0] * len(articles)
+        return self._score_fields({field: self._field_matrix(articles, field) for field in self.field_weights})
+
+    def _score_fields(self, fields: Dict) -> List[float]:
+        weighted = None
+        for field, (matrix, lengths) in fields.items():
+            normalization = 1.0 - self.b + self.b * lengths / self.average_lengths[field]
+            term = sparse.diags(self.field_weights[field] / normalization) @ matrix
+            weighted = term if weighted is None else weighted + term
+
+        # Saturate only the stored entries; absent keywords stay zero
+        weighted = weighted.tocsr()
+        weighted.data = weighted.data * (self.k1 + 1.0) / (weighted.data + self.k1)
+        return (weighted @ self.idf).tolist()
@@ -1,55 +1,81 @@
-from typing import List, Dict
-import requests
+from typing import List, Dict, Optional, Iterator
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from .base_fetcher import BaseFetcher
+from .http_client import HTTPClient
+from .article_index import ArticleIndex, canonical_url_key
 
 class DevToFetcher(BaseFetcher):
     """Fetches articles from Dev.to API."""
     
-    def __init__(self, config: Dict):
-        super().__init__(config)
+    def __init__(self, config: Dict, http_client: Optional[HTTPClient] = None):
+        super().__init__(config, http_client)
         self.api_key = config.get('api_key')  # Optional, but recommended
         self.tags = config.get('tags', ['ai', 'machinelearning', 'artificialintelligence'])
         self.base_url = "https://dev.to/api/articles"
+        self.max_concurrency = config.get('max_concurrency', 4)
 
     def fetch_articles(self) -> List[Dict]:
         try:
-            all_articles = []
-            headers = {}
-            if self.api_key:
-                headers['api-key'] = self.api_key
-            
-            # Fetch articles for each tag
-            for tag in self.tags:
-                self.logger.info(f"Fetching Dev.to articles with tag: {tag}")
-                
-                params = {
-                    'tag': tag,
-                    'top': 10,  # Get top articles
-                    'per_page': 30
-                }
-                
-                response = requests.get(self.base_url, headers=headers, params=params)
-                response.raise_for_status()
-                
-                articles = response.json()
-                for article in articles:
-                    formatted_article = {
-                        'title': article.get('title', ''),
-                        'url': article.get('url', ''),
-                        'summary': article.get('description', ''),
-                        'content': article.get('body_markdown', ''),
-                        'date': article.get('published_at', ''),
-                        'source': 'Dev.to',
-                        'topic': tag,
-                        'topic_hashtag': tag.title(),
-                        'relevance_score': article.get('positive_reactions_count', 0) / 100  # Use reactions as score
-                    }
-                    all_articles.append(self.format_article(formatted_article, 'Dev.to'))
-            
+            all_articles = list(self.iter_articles())
             self.logger.info(f"Fetched {len(all_articles)} articles from Dev.to")
             return all_articles
             
         except Exception as e:
             self.logger.error(f"Error fetching from Dev.to: {str(e)}")
             return []
+
+    def _fetch_tag(self, tag: str) -> List[Dict]:
+        """Fetch the raw top articles for one tag."""
+        self.logger.info(f"Fetching Dev.to articles with tag: {tag}")
+        
+        headers = {}
+        if self.api_key:
+            headers['api-key'] = self.api_key
+        
+        params = {
+            'tag': tag,
+            'top': 10,  # Get top articles
+            'per_page': 30
+        }
+        
+        response = self.http_client.get(self.base_url, headers=headers, params=params)
+        response.raise_for_status()
+        return response.json()
+    
+    def iter_articles(self) -> Iterator[Dict]:
+        """
+        Yield each distinct article once.
+        
+        Tags are fetched concurrently. The same article is usually listed
+        under several of them, so articles are deduplicated by id before
+        formatting and every tag an article appeared under is kept in its
+        ``topics`` list.
+        """
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_concurrency, len(self.tags) or 1))) as executor:
+            results = list(zip(self.tags, executor.map(self._fetch_tag, self.tags)))
+        
+        index = ArticleIndex()
+        for tag, articles in results:
+            for article in articles:
+                key = f"devto:{article['id']}" if article.get('id') else canonical_url_key(article.get('url', ''))
+                index.add(key, article, tag)
+        
+        if index.duplicates:
+            self.logger.info(f"Merged {index.duplicates} duplicate Dev.to articles across tags")
+        
+        for article, tags in index.items():
+            tag = tags[0]
+            formatted_article = {
+                'title': article.get('title', ''),
+                'url': article.get('url', ''),
+                'summary': article.get('description', ''),
+                'content': article.get('body_markdown', ''),
+                'date': article.get('published_at', ''),
+                'source': 'Dev.to',
+                'topic': tag,
+                'topic_hashtag': tag.title(),
+                'topics': tags,
+                'relevance_score': article.get('positive_reactions_count', 0) / 100  # Use reactions as score
+            }
+            yield self.format_article(formatted_article, 'Dev.to')
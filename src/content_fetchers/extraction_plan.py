@@ -0,0 +1,185 @@
+from typing import Dict, List, Optional, Tuple
+import json
+import threading
+import soupsieve
+
+# Selectors known to work on specific sites, tried before the generic ones
+SITE_SPECIFIC_PATTERNS = {
+    'theverge.com': {
+        'title': ['h2', '.heading-standard', '.font-polysans', 'h2 a', '.article-title', '.c-entry-title'],
+        'content': ['.duet--article--article-body-component', '.c-entry-content', '.article__body'],
+        'summary': ['.duet--article--article-body-component p:first-child', '.c-entry-summary', '.article__summary']
+    },
+    'zdnet.com': {
+        'title': ['h3', '.article__title', '.article-title', '.content-title'],
+        'content': ['.article__body', '.article-content', '.content-body'],
+        'summary': ['.article__summary', '.article-description', '.content-description']
+    }
+}
+
+TITLE_PATTERNS = [
+    'h1', 'h2', 'h3',  # Try any heading first
+    'h1 a', 'h2 a', 'h3 a',  # Then links within headings
+    'a',  # Then any link
+    '.title', '.headline', '.article-title'  # Finally, try classes
+]
+
+CONTENT_PATTERNS = [
+    '.article-content',
+    '.post-content',
+    '.entry-content',
+    '.content',
+    'article',
+    '.article-body',
+    '.post-body',
+    '.story-content'
+]
+
+SUMMARY_PATTERNS = [
+    '.article-summary',
+    '.post-summary',
+    '.entry-summary',
+    '.excerpt',
+    '.description',
+    'meta[name="description"]',
+    'meta[property="og:description"]',
+    '.article-excerpt',
+    '.post-excerpt',
+    'article p:first-child'
+]
+
+FIELDS = ('title', 'content', 'summary')
+
+# A selector tried this often on a domain without ever matching is no longer tried there
+MIN_MISSES_TO_SKIP = 20
+
+# Every this many runs, skipped selectors are tried again in case the site changed
+REPROBE_EVERY_RUNS = 10
+
+class ExtractionPlan:
+    """
+    Compiled selectors for extracting articles from one domain.
+
+    The plan is built once per domain with precompiled soupsieve selectors.
+    Selectors are always tried in their configured priority order, so the
+    first one that matches wins as before; the plan only counts how often
+    each one matched or was tried in vain, and drops selectors that never
+    match on the domain from the cascade. The counts can be saved and
+    restored so what was learned carries over between runs; every
+    ``REPROBE_EVERY_RUNS`` restores, dropped selectors get their misses
+    cleared and are tried again, so a redesign that makes one match again
+    is picked up.
+    """
+
+    def __init__(self, domain: str, stats: Optional[Dict[str, Dict[str, Dict[str, int]]]] = None):
+        self.domain = domain
+        site_patterns = SITE_SPECIFIC_PATTERNS.get(domain, {})
+        self.patterns = {
+            'title': site_patterns.get('title', []) + TITLE_PATTERNS,
+            'content': site_patterns.get('content', []) + CONTENT_PATTERNS,
+            'summary': site_patterns.get('summary', []) + SUMMARY_PATTERNS
+        }
+        self.compiled = {
+            pattern: soupsieve.compile(pattern)
+            for patterns in self.patterns.values()
+            for pattern in patterns
+        }
+        stats = stats or {}
+        self.hits = {field: dict(stats.get('hits', {}).get(field, {})) for field in FIELDS}
+        self.misses = {field: dict(stats.get('misses', {}).get(field, {})) for field in FIELDS}
+        self.runs = stats.get('runs', 0)
+        self.recorded = self._empty_stats()  # Counts since the plan was built
+        self.dirty = False
+        self._ordered = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, Dict[str, Dict[str, int]]]:
+        return {'hits': {field: {} for field in FIELDS}, 'misses': {field: {} for field in FIELDS}}
+
+    def _skipped(self, field: str, pattern: str) -> bool:
+        return not self.hits[field].get(pattern) and self.misses[field].get(pattern, 0) >= MIN_MISSES_TO_SKIP
+
+    def ordered(self, field: str) -> List[Tuple[str, soupsieve.SoupSieve]]:
+        """Get ``(pattern, compiled selector)`` pairs for a field in priority order, without dead selectors."""
+        ordered = self._ordered.get(field)
+        if ordered is None:
+            with self.lock:
+                ordered = [
+                    (pattern, self.compiled[pattern]) for pattern in self.patterns[field]
+                    if not self._skipped(field, pattern)
+                ]
+                self._ordered[field] = ordered
+        return ordered
+
+    def _count(self, kind: str, field: str, pattern: str, count: int = 1):
+        counts = getattr(self, kind)[field]
+        skipped = self._skipped(field, pattern)
+        counts[pattern] = counts.get(pattern, 0) + count
+        self.dirty = True
+        if self._skipped(field, pattern) != skipped:
+            self._ordered.pop(field, None)
+
+    def record(self, field: str, pattern: str):
+        """Count a successful extraction of a field with a pattern."""
+        with self.lock:
+            self._count('hits', field, pattern)
+            self.recorded['hits'][field][pattern] = self.recorded['hits'][field].get(pattern, 0) + 1
+
+    def miss(self, field: str, pattern: str):
+        """Count a pattern that was tried for a field and didn't produce it."""
+        with self.lock:
+            self._count('misses', field, pattern)
+            self.recorded['misses'][field][pattern] = self.recorded['misses'][field].get(pattern, 0) + 1
+
+    def merge(self, recorded: Dict[str, Dict[str, Dict[str, int]]]):
+        """Add counts recorded by a copy of this plan, e.g. in a worker process."""
+        with self.lock:
+            for kind in ('hits', 'misses'):
+                for field, counts in recorded.get(kind, {}).items():
+                    for pattern, count in counts.items():
+                        self._count(kind, field, pattern, count)
+
+    def state(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """Copy of the selector counts, for building the same plan elsewhere."""
+        with self.lock:
+            return {
+                'hits': {field: dict(counts) for field, counts in self.hits.items()},
+                'misses': {field: dict(counts) for field, counts in self.misses.items()},
+                'runs': self.runs
+            }
+
+    def _start_run(self):
+        """Count a run using the restored plan and re-probe dropped selectors when one is due."""
+        self.runs += 1
+        self.dirty = True
+        if self.runs % REPROBE_EVERY_RUNS:
+            return
+        for field in FIELDS:
+            for pattern in self.patterns[field]:
+                if self._skipped(field, pattern):
+                    del self.misses[field][pattern]
+        self._ordered.clear()
+
+    def dumps(self) -> str:
+        """Serialize the learned selector counts."""
+        state = self.state()
+        with self.lock:
+            self.dirty = False
+        return json.dumps(state)
+
+    @classmethod
+    def loads(cls, domain: str, value: Optional[str]) -> 'ExtractionPlan':
+        """Build a plan, restoring selector counts saved by ``dumps``."""
+        stats = None
+        if value:
+            try:
+                stats = json.loads(value)
+            except ValueError:
+                stats = None
+        # Older saves only held success counts, which no longer affect the order
+        if not isinstance(stats, dict) or 'misses' not in stats:
+            stats = None
+        plan = cls(domain, stats)
+        plan._start_run()
+        return plan
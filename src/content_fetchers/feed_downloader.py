@@ -0,0 +1,185 @@
+from typing import List, Dict, Optional, Iterator, Tuple
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+import logging
+import multiprocessing
+import feedparser
+import requests
+from .http_cache import HTTPCache
+from .http_client import HTTPClient
+
+
+def parse_feed(content: bytes, url: str = '', content_type: str = '') -> Dict:
+    """
+    Parse raw feed bytes into plain dicts.
+
+    The result only holds built-in types so it can be returned from a
+    worker process, and keeps the ``feed``/``entries`` shape of a
+    feedparser result.
+    """
+    response_headers = {'content-location': url}
+    if content_type:
+        response_headers['content-type'] = content_type
+    return simplify_feed(feedparser.parse(content, response_headers=response_headers))
+
+
+def simplify_feed(feed) -> Dict:
+    """Convert a feedparser result into the plain ``feed``/``entries`` shape."""
+    feed_info = {}
+    if 'title' in feed.feed:
+        feed_info['title'] = feed.feed.get('title')
+
+    return {
+        'feed': feed_info,
+        'entries': [_simplify_entry(entry) for entry in feed.entries]
+    }
+
+
+def _simplify_entry(entry) -> Dict:
+    """Reduce a feedparser entry to the fields the fetchers use."""
+    simplified = {}
+    for key in ('id', 'title', 'link', 'summary', 'description', 'published'):
+        if key in entry:
+            simplified[key] = entry.get(key)
+    if 'content' in entry:
+        simplified['content'] = [{'value': item.get('value', '')} for item in entry.content]
+    if 'source' in entry:
+        simplified['source'] = {key: value for key, value in entry.source.items() if isinstance(value, str)}
+    return simplified
+
+
+def fetch_feed(url: str, http_client: Optional[HTTPClient] = None, cache: Optional[HTTPCache] = None) -> Dict:
+    """
+    Download and parse a single feed.
+
+    With a cache, the stored validators are sent along and an unchanged
+    feed is answered from the cached entries without being parsed again.
+    """
+    http_client = http_client or HTTPClient.shared()
+    headers = cache.conditional_headers(url) if cache else {}
+    response = http_client.get(url, headers=headers)
+
+    if response.status_code == 304:
+        cached = cache.get_payload(url) if cache else None
+        if cached is not None:
+            return cached
+        # Validators are stored but the entries aren't: ask for the full feed
+        response = http_client.get(url)
+
+    response.raise_for_status()
+    parsed = parse_feed(response.content, url, response.headers.get('Content-Type', ''))
+    if cache:
+        cache.store(url, response.headers.get('ETag'), response.headers.get('Last-Modified'), parsed)
+    return parsed
+
+
+class FeedDownloader:
+    """Downloads feeds concurrently over the pooled HTTP client and parses them in a worker pool."""
+
+    def __init__(self, max_concurrency: int = 8, parse_workers: int = 0,
+                 cache: Optional[HTTPCache] = None, http_client: Optional[HTTPClient] = None):
+        self.logger = logging.getLogger(__name__)
+        self.cache = cache
+        self.http_client = http_client or HTTPClient.shared()
+        self.max_concurrency = max(1, max_concurrency)
+        self.parse_workers = parse_workers
+
+        # Created with the fetcher, before any fetch threads run, and reused across runs.
+        # Workers are spawned rather than forked since they start while fetch threads are running.
+        self._parse_pool = None
+        if self.parse_workers > 0:
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=self.parse_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+
+    def _download(self, url: str) -> requests.Response:
+        headers = self.cache.conditional_headers(url) if self.cache else {}
+        response = self.http_client.get(url, headers=headers)
+        if response.status_code == 304 and (not self.cache or self.cache.get_payload(url) is None):
+            # Validators are stored but the entries aren't: ask for the full feed
+            response = self.http_client.get(url)
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+
+    def _store(self, url: str, response: requests.Response, parsed: Dict):
+        """Remember the response validators and parsed entries for next time."""
+        if self.cache:
+            self.cache.store(url, response.headers.get('ETag'), response.headers.get('Last-Modified'), parsed)
+
+    def fetch(self, urls: List[str]) -> Dict[str, Dict]:
+        """
+        Download and parse all feed URLs.
+
+        Returns:
+            Dict[str, Dict]: Parsed feeds keyed by URL, in the shape
+            returned by ``parse_feed``.
+        """
+        return dict(self.iter_fetch(urls))
+
+    def iter_fetch(self, urls: List[str]) -> Iterator[Tuple[str, Dict]]:
+        """
+        Download and parse all feed URLs, yielding ``(url, feed)`` as each one is ready.
+
+        Parsing starts as soon as each download completes, so it overlaps
+        with the remaining downloads. Feeds the server reports as not
+        modified are served from the cache without parsing. Feeds that fail
+        to download or parse are logged and skipped.
+        """
+        parse_pool = self._parse_pool
+        download_pool = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='feed-download')
+        pending = {download_pool.submit(self._download, url): (url, None) for url in urls}
+
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url, response = pending.pop(future)
+
+                    # Finished parse job
+                    if response is not None:
+                        try:
+                            parsed = future.result()
+                            self._store(url, response, parsed)
+                        except Exception as e:
+                            self.logger.error(f"Error parsing feed {url}: {str(e)}")
+                            continue
+                        yield url, parsed
+                        continue
+
+                    # Finished download
+                    try:
+                        response = future.result()
+                    except Exception as e:
+                        self.logger.error(f"Error downloading feed {url}: {str(e)}")
+                        continue
+
+                    if response.status_code == 304:
+                        cached = self.cache.get_payload(url) if self.cache else None
+                        if cached is not None:
+                            self.logger.info(f"Feed not modified, using cached entries: {url}")
+                            yield url, cached
+                        else:
+                            self.logger.warning(f"Feed not modified but no cached entries found: {url}")
+                        continue
+
+                    content_type = response.headers.get('Content-Type', '')
+                    if parse_pool:
+                        pending[parse_pool.submit(parse_feed, response.content, url, content_type)] = (url, response)
+                        continue
+
+                    try:
+                        parsed = parse_feed(response.content, url, content_type)
+                        self._store(url, response, parsed)
+                    except Exception as e:
+                        self.logger.error(f"Error parsing feed {url}: {str(e)}")
+                        continue
+                    yield url, parsed
+        finally:
+            download_pool.shutdown(wait=False, cancel_futures=True)
+
+    def close(self):
+        """Release parse workers."""
+        if self._parse_pool:
+            self._parse_pool.shutdown()
+            self._parse_pool = None
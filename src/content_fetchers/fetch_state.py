@@ -0,0 +1,71 @@
+import logging
+import sqlite3
+from typing import Dict, List, Optional
+
+class FetchState:
+    """
+    Persistent cursors for incremental fetching.
+
+    Fetchers store small string values here (high-water marks, since_ids,
+    resolved ids) under keys of their own choosing, so each run only asks
+    sources for what is new since the previous one.
+    """
+
+    def __init__(self, db_path: str = "posts.db"):
+        self.logger = logging.getLogger(__name__)
+        self.db_path = db_path
+        self._init_db()
+
+    def _init_db(self):
+        """Initialize the database with required tables."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS fetch_state (
+                        key TEXT PRIMARY KEY,
+                        value TEXT,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                conn.commit()
+        except Exception as e:
+            self.logger.error(f"Error initializing fetch state: {str(e)}")
+            raise
+
+    def get(self, key: str) -> Optional[str]:
+        """Get the stored value for a key."""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: List[str]) -> Dict[str, str]:
+        """Get the stored values for several keys in one query."""
+        if not keys:
+            return {}
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                placeholders = ','.join('?' * len(keys))
+                cursor.execute(f"SELECT key, value FROM fetch_state WHERE key IN ({placeholders})", keys)
+                return dict(cursor.fetchall())
+        except Exception as e:
+            self.logger.error(f"Error reading fetch state: {str(e)}")
+            return {}
+
+    def set(self, key: str, value: str):
+        """Store a value for a key."""
+        self.set_many({key: value})
+
+    def set_many(self, values: Dict[str, str]):
+        """Store several values in one transaction."""
+        if not values:
+            return
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.executemany(
+                    "INSERT OR REPLACE INTO fetch_state (key, value, updated_at) VALUES (?, ?, datetime('now'))",
+                    [(key, str(value)) for key, value in values.items()]
+                )
+                conn.commit()
+        except Exception as e:
+            self.logger.error(f"Error writing fetch state: {str(e)}")
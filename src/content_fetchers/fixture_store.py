@@ -0,0 +1,86 @@
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from http.client import responses as HTTP_REASONS
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import os
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Never written to disk or used to match requests
+SECRET_PARAMS = ('apikey', 'api_key', 'api-key', 'token', 'access_token', 'key')
+
+# Describe the transport, not the recorded body, so they are dropped when saving
+TRANSPORT_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding', 'connection', 'set-cookie')
+
+class FixtureStore:
+    """
+    Compressed on-disk corpus of recorded HTTP responses.
+
+    Each response is stored as a gzipped JSON file named after a hash of the
+    request, so a recorded run can be replayed deterministically without
+    network access. Secret query parameters and any configured volatile ones
+    (such as date ranges) are left out of the request key.
+    """
+
+    def __init__(self, path: str, ignore_params: Optional[List[str]] = None):
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self.ignore_params = set(SECRET_PARAMS) | {param.lower() for param in (ignore_params or [])}
+        os.makedirs(self.path, exist_ok=True)
+
+    def _canonical_url(self, url: str, params: Optional[Dict] = None) -> str:
+        """URL with merged, sorted query parameters and ignored ones removed."""
+        prepared = requests.Request('GET', url, params=params).prepare().url
+        parts = urlsplit(prepared)
+        query = sorted(
+            (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if key.lower() not in self.ignore_params
+        )
+        return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, urlencode(query), ''))
+
+    def _fixture_path(self, method: str, canonical_url: str) -> str:
+        digest = hashlib.sha1(f"{method.upper()} {canonical_url}".encode('utf-8')).hexdigest()
+        return os.path.join(self.path, f"{digest}.json.gz")
+
+    def save(self, method: str, url: str, params: Optional[Dict], response: requests.Response):
+        """Record a response."""
+        canonical_url = self._canonical_url(url, params)
+        record = {
+            'method': method.upper(),
+            'url': canonical_url,
+            'status_code': response.status_code,
+            'headers': {
+                key: value for key, value in response.headers.items()
+                if key.lower() not in TRANSPORT_HEADERS
+            },
+            'body': base64.b64encode(response.content).decode('ascii')
+        }
+        try:
+            with gzip.open(self._fixture_path(method, canonical_url), 'wt', encoding='utf-8') as f:
+                json.dump(record, f)
+        except Exception as e:
+            self.logger.error(f"Error recording fixture for {url}: {str(e)}")
+
+    def load(self, method: str, url: str, params: Optional[Dict] = None) -> Optional[requests.Response]:
+        """Rebuild a recorded response, or None if the request was never recorded."""
+        canonical_url = self._canonical_url(url, params)
+        fixture_path = self._fixture_path(method, canonical_url)
+        if not os.path.exists(fixture_path):
+            return None
+
+        with gzip.open(fixture_path, 'rt', encoding='utf-8') as f:
+            record = json.load(f)
+
+        response = requests.Response()
+        response.status_code = record['status_code']
+        response.reason = HTTP_REASONS.get(response.status_code, '')
+        response.headers = CaseInsensitiveDict(record['headers'])
+        response._content = base64.b64decode(record['body'])
+        response._content_consumed = True  # Lets streaming callers iterate the recorded body
+        response.url = requests.Request('GET', url, params=params).prepare().url
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
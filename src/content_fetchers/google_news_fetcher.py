@@ -1,45 +1,158 @@
-from typing import List, Dict
-import feedparser
+from typing import List, Dict, Optional, Iterator, Tuple
 from datetime import datetime, timedelta
 from .base_fetcher import BaseFetcher
+from .http_client import HTTPClient
+from .feed_downloader import FeedDownloader, fetch_feed
+from .http_cache import HTTPCache
+from .article_index import ArticleIndex, canonical_url_key
+from .url_canonicalizer import LinkResolver
 
 class GoogleNewsFetcher(BaseFetcher):
     """Fetches articles from Google News RSS feeds."""
     
-    def __init__(self, config: Dict):
-        super().__init__(config)
-        self.topics = config.get('topics', ['artificial intelligence', 'machine learning'])
+    def __init__(self, config: Dict, http_client: Optional[HTTPClient] = None):
+        super().__init__(config, http_client)
+        google_news_config = config.get('sources', {}).get('google_news', config)
+        self.topics = google_news_config.get('topics', ['artificial intelligence', 'machine learning'])
         self.base_url = "https://news.google.com/rss/search"
-        self.max_articles = config.get('max_articles', 50)
-
+        self.max_articles = google_news_config.get('max_articles', 50)
+        
+        # Optionally revalidate feeds with conditional GETs instead of re-downloading them
+        self.http_cache = None
+        if google_news_config.get('conditional_get', False):
+            self.http_cache = HTTPCache(config.get('cache', {}).get('http_cache_path', 'http_cache.db'))
+        
+        # Optionally download all topic feeds concurrently and parse them in a worker pool
+        self.downloader = None
+        if google_news_config.get('parallel', False):
+            self.downloader = FeedDownloader(
+                max_concurrency=google_news_config.get('max_concurrency', 8),
+                parse_workers=google_news_config.get('parse_workers', 0),
+                cache=self.http_cache,
+                http_client=self.http_client
+            )
+        
+        # Optionally replace news.google.com redirect links with the publishers' URLs
+        self.link_resolver = None
+        if google_news_config.get('resolve_links', False):
+            self.link_resolver = LinkResolver(
+                {
+                    'max_concurrency': google_news_config.get('max_concurrency', 8),
+                    'request_budget': google_news_config.get('resolve_budget', 20),
+                    'cache_path': config.get('cache', {}).get('http_cache_path', 'http_cache.db')
+                },
+                self.http_client
+            )
+    
+    def _topic_url(self, topic: str) -> str:
+        """Create Google News search URL for a topic."""
+        query = topic.replace(' ', '+')
+        return f"{self.base_url}?q={query}&hl=en-US&gl=US&ceid=US:en"
+    
+    def close(self):
+        """Shut down the feed parse workers."""
+        if self.downloader:
+            self.downloader.close()
+    
     def fetch_articles(self) -> List[Dict]:
         try:
-            all_articles = []
-            for topic in self.topics:
-                # Create Google News search URL
-                query = topic.replace(' ', '+')
-                url = f"{self.base_url}?q={query}&hl=en-US&gl=US&ceid=US:en"
-                
-                self.logger.info(f"Fetching Google News for topic: {topic}")
-                feed = feedparser.parse(url)
-                
-                # Process each entry
-                for entry in feed.entries[:self.max_articles]:  # Limit articles per topic
-                    article = {
-                        'title': entry.get('title', ''),
-                        'url': entry.get('link', ''),
-                        'summary': entry.get('description', ''),
-                        'content': entry.get('content', [{}])[0].get('value', ''),
-                        'date': entry.get('published', ''),
-                        'source': entry.get('source', {}).get('title', 'Google News'),
-                        'topic': topic,
-                        'topic_hashtag': topic.replace(' ', '').title()
-                    }
-                    all_articles.append(self.format_article(article, 'Google News'))
-                
+            all_articles = list(self.iter_articles())
             self.logger.info(f"Fetched {len(all_articles)} articles from Google News")
             return all_articles
-            
+        
         except Exception as e:
             self.logger.error(f"Error fetching from Google News: {str(e)}")
             return []
+    
+    def iter_articles(self) -> Iterator[Dict]:
+        """
+        Yield each distinct article once, topic by topic as each feed arrives.
+        
+        Overlapping topics return many of the same stories, so entries are
+        deduplicated across topics before formatting. An article is yielded
+        under the first topic it arrives with; topics it turns up under
+        later are added to the ``topics`` list of the yielded article.
+        """
+        index = ArticleIndex()
+        waiting = []
+        missing_count = 0
+        for topic, feed in self._iter_topic_feeds():
+            new_entries = []
+            for entry in feed['entries'][:self.max_articles]:  # Limit articles per topic
+                topics = index.add(entry.get('id') or canonical_url_key(entry.get('link', '')), entry, topic)
+                if topics is not None:
+                    new_entries.append((entry, topics))
+            
+            if not self.link_resolver:
+                for entry, topics in new_entries:
+                    yield self._format_entry(entry, topics)
+                continue
+            
+            # Publisher URLs let the same story from a publisher's own feed dedupe against it.
+            # Links resolvable without a request go out now; requested ones follow the last feed in batches.
+            resolved, missing = self.link_resolver.lookup(entry.get('link', '') for entry, _ in new_entries)
+            missing_count += len(missing)
+            budget = max(0, self.link_resolver.request_budget - len(waiting))
+            requested = set(missing[:budget])
+            for entry, topics in new_entries:
+                if entry.get('link') in requested:
+                    waiting.append((entry, topics))
+                    continue
+                article = self._format_entry(entry, topics)
+                article['url'] = resolved.get(article['url'], article['url'])
+                yield article
+        
+        if index.duplicates:
+            self.logger.info(f"Merged {index.duplicates} duplicate Google News entries across topics")
+        
+        if not self.link_resolver:
+            return
+        
+        batch_size = self.link_resolver.max_concurrency
+        for start in range(0, len(waiting), batch_size):
+            batch = waiting[start:start + batch_size]
+            resolved = self.link_resolver.fetch(list(dict.fromkeys(entry['link'] for entry, _ in batch)))
+            for entry, topics in batch:
+                article = self._format_entry(entry, topics)
+                article['url'] = resolved.get(article['url'], article['url'])
+                yield article
+        
+        if missing_count:
+            self.logger.info(
+                f"Requested {len(waiting)} Google News links, {missing_count - len(waiting)} left for later runs"
+            )
+    
+    def _iter_topic_feeds(self) -> Iterator[Tuple[str, Dict]]:
+        """Yield ``(topic, feed)`` pairs as each topic feed becomes available."""
+        if self.downloader:
+            self.logger.info(f"Fetching Google News for {len(self.topics)} topics in parallel")
+            topics_by_url = {self._topic_url(topic): topic for topic in self.topics}
+            for url, feed in self.downloader.iter_fetch(list(topics_by_url)):
+                yield topics_by_url[url], feed
+            return
+        
+        for topic in self.topics:
+            self.logger.info(f"Fetching Google News for topic: {topic}")
+            try:
+                feed = fetch_feed(self._topic_url(topic), self.http_client, self.http_cache)
+            except Exception as e:
+                self.logger.error(f"Error fetching Google News for topic {topic}: {str(e)}")
+                continue
+            yield topic, feed
+    
+    def _format_entry(self, entry: Dict, topics: List[str]) -> Dict:
+        """Format a feed entry found under one or more topics."""
+        topic = topics[0]
+        article = {
+            'title': entry.get('title', ''),
+            'url': entry.get('link', ''),
+            'summary': entry.get('description', ''),
+            'content': entry.get('content', [{}])[0].get('value', ''),
+            'date': entry.get('published', ''),
+            'source': entry.get('source', {}).get('title', 'Google News'),
+            'topic': topic,
+            'topic_hashtag': topic.replace(' ', '').title(),
+            'topics': topics
+        }
+        return self.format_article(article, 'Google News')
+        
\ No newline at end of file
@@ -0,0 +1,98 @@
+from typing import Callable, List, Optional
+import logging
+import re
+from bs4 import BeautifulSoup, SoupStrainer
+
+# lxml builds the tree in C and is several times faster than html.parser
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+FALLBACK_PARSER = 'html.parser'
+
+logger = logging.getLogger(__name__)
+
+_TAG_SELECTOR = re.compile(r'^[a-zA-Z][a-zA-Z0-9-]*$')
+_CLASS_SELECTOR = re.compile(r'^\.([\w-]+)$')
+_CLASS_CONTAINS_SELECTOR = re.compile(r'^\[class\*=["\']?([\w-]+)["\']?\]$')
+
+
+def resolve_parser(name: Optional[str] = 'lxml') -> str:
+    """Pick the BeautifulSoup tree builder, falling back to html.parser."""
+    name = name or 'lxml'
+    if name.startswith('lxml') and not LXML_AVAILABLE:
+        logger.warning(f"lxml is not installed, falling back to {FALLBACK_PARSER}")
+        return FALLBACK_PARSER
+    return name
+
+
+def _selector_matcher(selector: str) -> Optional[Callable[[str, List[str], str], bool]]:
+    """Matcher for the simple selectors a strainer can evaluate during parsing."""
+    selector = selector.strip()
+    if _TAG_SELECTOR.match(selector):
+        tag_name = selector.lower()
+        return lambda name, classes, class_attr: name == tag_name
+
+    match = _CLASS_SELECTOR.match(selector)
+    if match:
+        class_name = match.group(1)
+        return lambda name, classes, class_attr: class_name in classes
+
+    match = _CLASS_CONTAINS_SELECTOR.match(selector)
+    if match:
+        fragment = match.group(1)
+        return lambda name, classes, class_attr: fragment in class_attr
+
+    return None
+
+
+class ContainerStrainer(SoupStrainer):
+    """
+    Strainer that keeps only elements matching any of a set of selectors.
+
+    Matching elements are kept with their whole subtree, so selecting with
+    the same selectors on the restricted tree finds the same containers as
+    on the full document.
+    """
+
+    def __init__(self, matchers: List[Callable[[str, List[str], str], bool]]):
+        super().__init__()
+        self.matchers = matchers
+
+    def _matches(self, name: Optional[str], attrs) -> bool:
+        class_value = (attrs or {}).get('class') or ''
+        classes = class_value.split() if isinstance(class_value, str) else list(class_value)
+        class_attr = ' '.join(classes)
+        name = (name or '').lower()
+        return any(matcher(name, classes, class_attr) for matcher in self.matchers)
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        # Consulted by bs4 >= 4.13 for each tag outside a kept subtree
+        return self._matches(name, attrs)
+
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        # Consulted by older bs4 releases; only names and attributes reach it while parsing
+        if isinstance(markup_name, str):
+            return markup_name if self._matches(markup_name, markup_attrs) else None
+        return super().search_tag(markup_name, markup_attrs)
+
+
+def container_strainer(selectors: List[str]) -> Optional[ContainerStrainer]:
+    """
+    Build a strainer for the given container selectors.
+
+    Only tag, ``.class`` and ``[class*=...]`` selectors can be checked
+    while parsing; if any selector is more complex None is returned and the
+    caller should parse the whole page.
+    """
+    matchers = [_selector_matcher(selector) for selector in selectors]
+    if not matchers or any(matcher is None for matcher in matchers):
+        return None
+    return ContainerStrainer(matchers)
+
+
+def parse_html(html_content: str, parser: str = 'lxml', parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """Parse HTML with the given builder, optionally building only strained subtrees."""
+    return BeautifulSoup(html_content, parser, parse_only=parse_only)
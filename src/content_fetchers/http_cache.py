@@ -0,0 +1,97 @@
+import json
+import logging
+import sqlite3
+from typing import Any, Dict, Optional
+
+class HTTPCache:
+    """
+    Persistent store of HTTP validators (ETag / Last-Modified) per URL.
+
+    Alongside the validators it keeps the records that were parsed from the
+    last full response, so a ``304 Not Modified`` can be answered from the
+    cache without downloading or parsing anything.
+    """
+
+    def __init__(self, db_path: str = "http_cache.db"):
+        self.logger = logging.getLogger(__name__)
+        self.db_path = db_path
+        self._init_db()
+
+    def _init_db(self):
+        """Initialize the database with required tables."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS http_cache (
+                        url TEXT PRIMARY KEY,
+                        etag TEXT,
+                        last_modified TEXT,
+                        payload TEXT,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                conn.commit()
+        except Exception as e:
+            self.logger.error(f"Error initializing HTTP cache: {str(e)}")
+            raise
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Get the cached validators and payload for a URL."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT etag, last_modified, payload FROM http_cache WHERE url = ?",
+                    (url,)
+                )
+                row = cursor.fetchone()
+        except Exception as e:
+            self.logger.error(f"Error reading HTTP cache for {url}: {str(e)}")
+            return None
+
+        if not row or row[2] is None:
+            return None
+
+        return {
+            'etag': row[0],
+            'last_modified': row[1],
+            'payload': json.loads(row[2])
+        }
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers for a cached URL."""
+        entry = self.get(url)
+        headers = {}
+        if entry:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def get_payload(self, url: str) -> Optional[Any]:
+        """Get the records parsed from the last full response for a URL."""
+        entry = self.get(url)
+        return entry['payload'] if entry else None
+
+    def store(self, url: str, etag: Optional[str], last_modified: Optional[str], payload: Any):
+        """Store validators and parsed records for a URL.
+
+        Nothing is stored when the server sent no validators, since the
+        entry could never be revalidated.
+        """
+        if not etag and not last_modified:
+            return
+
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """INSERT OR REPLACE INTO http_cache (url, etag, last_modified, payload, updated_at)
+                       VALUES (?, ?, ?, ?, datetime('now'))""",
+                    (url, etag, last_modified, json.dumps(payload))
+                )
+                conn.commit()
+        except Exception as e:
+            self.logger.error(f"Error writing HTTP cache for {url}: {str(e)}")
@@ -0,0 +1,144 @@
+from typing import Dict, Optional
+import logging
+import random
+import threading
+import time
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from .rate_limiter import RateLimiter
+from .fixture_store import FixtureStore
+
+# urllib3 decodes brotli responses transparently when either package is installed
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+CONDITIONAL_HEADERS = ('if-none-match', 'if-modified-since')
+
+class HTTPClient:
+    """
+    Shared HTTP transport for fetchers and the scraper.
+
+    Wraps a single ``requests.Session`` so connections are kept alive and
+    pooled per host, responses are gzip/brotli decoded, every request gets a
+    timeout, requests are paced by per-host token buckets, and transient
+    failures are retried with jittered exponential backoff.
+
+    With ``fixtures.mode`` set to ``record`` every response is also saved to
+    a fixture store; in ``replay`` mode responses are served from that store
+    and the network is never touched.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, config: Optional[Dict] = None):
+        self.logger = logging.getLogger(__name__)
+        config = config or {}
+
+        self.timeout = (config.get('connect_timeout', 10), config.get('read_timeout', 30))
+        self.max_retries = config.get('max_retries', 2)
+        self.backoff_factor = config.get('backoff_factor', 0.5)
+        self.max_backoff = config.get('max_backoff', 30)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=config.get('max_hosts', 20),  # Number of per-host pools kept
+            pool_maxsize=config.get('pool_maxsize', 10),  # Keep-alive connections per host
+            max_retries=0  # Retries are handled here so they can back off
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers['Accept-Encoding'] = 'gzip, deflate, br' if BROTLI_AVAILABLE else 'gzip, deflate'
+
+        # Shared pacing for every host this client talks to
+        self.rate_limiter = RateLimiter(config.get('rate_limits', {}))
+
+        # Optional record/replay of responses for offline runs and benchmarks
+        fixtures_config = config.get('fixtures', {})
+        self.fixture_mode = fixtures_config.get('mode')
+        self.fixtures = None
+        if self.fixture_mode in ('record', 'replay'):
+            self.fixtures = FixtureStore(
+                fixtures_config.get('path', 'fixtures'),
+                ignore_params=fixtures_config.get('ignore_params', [])
+            )
+
+    @classmethod
+    def shared(cls) -> 'HTTPClient':
+        """Get the process-wide client used when none is injected."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def _backoff_delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """Full-jitter exponential backoff, honouring a numeric Retry-After header."""
+        if response is not None:
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                return min(float(retry_after), self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * (2 ** attempt)))
+
+    def request(self, method: str, url: str, retries: Optional[int] = None, **kwargs) -> requests.Response:
+        """
+        Send a request, retrying connection errors, timeouts and 429/5xx responses.
+
+        The last response is returned even if it still has a retryable
+        status, so callers decide whether to ``raise_for_status()``.
+        """
+        if self.fixture_mode == 'replay':
+            response = self.fixtures.load(method, url, kwargs.get('params'))
+            if response is None:
+                raise requests.ConnectionError(f"No recorded response for {method} {url}")
+            return response
+
+        # A 304 can't be replayed without this machine's cache, so recordings always ask for the full response
+        if self.fixture_mode == 'record' and kwargs.get('headers'):
+            kwargs['headers'] = {
+                key: value for key, value in kwargs['headers'].items()
+                if key.lower() not in CONDITIONAL_HEADERS
+            }
+
+        retries = self.max_retries if retries is None else retries
+        kwargs.setdefault('timeout', self.timeout)
+        host = urlparse(url).hostname or ''
+
+        for attempt in range(retries + 1):
+            self.rate_limiter.acquire(host)
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+                self.logger.warning(f"Request to {url} failed ({str(e)}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+
+            self.rate_limiter.update(host, response)
+            if response.status_code not in RETRY_STATUS_CODES or attempt >= retries:
+                if self.fixture_mode == 'record':
+                    self.fixtures.save(method, url, kwargs.get('params'), response)
+                return response
+
+            delay = self._backoff_delay(attempt, response)
+            self.logger.warning(f"Request to {url} returned {response.status_code}, retrying in {delay:.1f}s")
+            response.close()
+            time.sleep(delay)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def close(self):
+        """Close all pooled connections."""
+        self.session.close()
@@ -0,0 +1,66 @@
+import re
+from collections import Counter
+from typing import Dict, Iterable, Set
+
+
+def normalize_keyword(keyword: str) -> str:
+    """Lowercase a keyword and collapse its whitespace."""
+    return ' '.join(keyword.lower().split())
+
+
+class KeywordMatcher:
+    """
+    Finds which of a set of keywords occur in a text in a single pass.
+
+    All keywords are compiled into one case-insensitive alternation, longest
+    first, matched on word boundaries so short keywords like ``ai`` don't
+    match inside words like "said". A plural ``s`` is allowed, and
+    whitespace inside multi-word keywords matches any whitespace. Keywords
+    that contain another keyword as a whole word report both when found.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = list(dict.fromkeys(
+            normalize_keyword(keyword) for keyword in keywords if keyword and keyword.strip()
+        ))
+
+        self.pattern = None
+        if self.keywords:
+            alternatives = '|'.join(
+                r'\s+'.join(re.escape(word) for word in keyword.split())
+                for keyword in sorted(self.keywords, key=len, reverse=True)
+            )
+            self.pattern = re.compile(rf'(?<!\w)({alternatives})s?(?!\w)', re.IGNORECASE)
+
+        # A match of "machine learning" also counts as a match of "learning"
+        self.implied: Dict[str, Set[str]] = {}
+        for keyword in self.keywords:
+            self.implied[keyword] = {
+                other for other in self.keywords
+                if re.search(rf'(?<!\w){re.escape(other)}(?!\w)', keyword)
+            }
+
+    @classmethod
+    def from_config(cls, config: Dict) -> 'KeywordMatcher':
+        """Matcher for the configured ``filtering.keywords``, shared by the scraper and the filter."""
+        return cls(config.get('filtering', {}).get('keywords', []))
+
+    def find(self, text: str) -> Set[str]:
+        """Normalized keywords that occur in the text."""
+        found = set()
+        if not text or self.pattern is None:
+            return found
+        for match in self.pattern.finditer(text):
+            keyword = normalize_keyword(match.group(1))
+            found.update(self.implied.get(keyword, (keyword,)))
+        return found
+
+    def count(self, text: str) -> Counter:
+        """Occurrences of each normalized keyword in the text."""
+        counts = Counter()
+        if not text or self.pattern is None:
+            return counts
+        for match in self.pattern.finditer(text):
+            keyword = normalize_keyword(match.group(1))
+            counts.update(self.implied.get(keyword, (keyword,)))
+        return counts
@@ -0,0 +1,122 @@
+import hashlib
+import random
+import re
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+NUM_PERMUTATIONS = 64
+MERSENNE_PRIME = (1 << 61) - 1
+
+# Chance that a pair exactly at the threshold shares a bucket when the band layout is derived
+TARGET_RECALL = 0.95
+
+# Signatures are persisted, so the permutations must be the same on every run
+_rng = random.Random(20240101)
+PERMUTATIONS = [
+    (_rng.randrange(1, MERSENNE_PRIME), _rng.randrange(0, MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+# Words too common to say anything about which story a text is about
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'have', 'in',
+    'is', 'it', 'its', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'was', 'will', 'with'
+}
+
+_WORD_PATTERN = re.compile(r'\w+')
+
+# Links are shared boilerplate (scheme, aggregator host, path segments), not story words
+_URL_PATTERN = re.compile(r'(?:https?://|www\.)\S+', re.I)
+
+
+def shingles(text: str) -> Set[str]:
+    """Distinct words of a plain text without URLs and stopwords."""
+    text = _URL_PATTERN.sub(' ', text.lower())
+    return {word for word in _WORD_PATTERN.findall(text) if word not in STOPWORDS}
+
+
+def minhash(text: str) -> Tuple[int, ...]:
+    """
+    MinHash signature of a text's words.
+
+    The fraction of positions two signatures agree on estimates the Jaccard
+    similarity of the texts' word sets. Returns an empty signature for a
+    text without words.
+    """
+    hashes = [
+        int.from_bytes(hashlib.blake2b(word.encode('utf-8'), digest_size=8).digest(), 'big')
+        for word in shingles(text)
+    ]
+    if not hashes:
+        return ()
+    return tuple(
+        min((a * value + b) % MERSENNE_PRIME for value in hashes)
+        for a, b in PERMUTATIONS
+    )
+
+
+def similarity(first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    if not first or len(first) != len(second):
+        return 0.0
+    return sum(1 for x, y in zip(first, second) if x == y) / len(first)
+
+
+def collision_probability(similarity: float, rows: int) -> float:
+    """Chance that two signatures of the given similarity share a band of ``rows`` rows."""
+    return 1.0 - (1.0 - similarity ** rows) ** (NUM_PERMUTATIONS // rows)
+
+
+def rows_for_threshold(threshold: float, recall: float = TARGET_RECALL) -> int:
+    """Most rows per band whose collision chance at ``threshold`` is still at least ``recall``."""
+    rows = 1
+    while rows < NUM_PERMUTATIONS and collision_probability(threshold, rows + 1) >= recall:
+        rows += 1
+    return rows
+
+
+class MinHashLSH:
+    """
+    Locality-sensitive index of MinHash signatures.
+
+    Signatures are split into bands and bucketed by each band, so only
+    items sharing a whole band are compared. A pair of similarity s shares
+    a bucket with probability 1 - (1 - s^rows)^bands. Unless ``bands`` is
+    given, the band layout is the one with the widest bands that still
+    reaches ``TARGET_RECALL`` at the threshold, e.g. 21 bands of 3 rows for
+    0.6, which catches about 99% of pairs at 0.6. Each lookup costs one
+    probe per band instead of a scan of all items.
+    """
+
+    def __init__(self, threshold: float = 0.6, bands: Optional[int] = None):
+        self.threshold = threshold
+        if bands is None:
+            self.rows = rows_for_threshold(threshold)
+        else:
+            self.rows = max(1, NUM_PERMUTATIONS // bands)
+        self.bands = NUM_PERMUTATIONS // self.rows
+        self.buckets: List[Dict[Tuple[int, ...], List]] = [{} for _ in range(self.bands)]
+        self.size = 0
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, ...]]:
+        return [signature[band * self.rows:(band + 1) * self.rows] for band in range(self.bands)]
+
+    def add(self, signature: Tuple[int, ...], item: Any = True):
+        """Index a signature with an item to return when it is matched."""
+        if not signature:
+            return
+        for buckets, key in zip(self.buckets, self._band_keys(signature)):
+            buckets.setdefault(key, []).append((signature, item))
+        self.size += 1
+
+    def find(self, signature: Tuple[int, ...]) -> Optional[Any]:
+        """Item of an indexed signature at least ``threshold`` similar, or None."""
+        if not signature:
+            return None
+        for buckets, key in zip(self.buckets, self._band_keys(signature)):
+            for candidate, item in buckets.get(key, ()):
+                if similarity(candidate, signature) >= self.threshold:
+                    return item
+        return None
+
+    def __len__(self) -> int:
+        return self.size
@@ -1,14 +1,18 @@
 import requests
-from datetime import datetime, timedelta
-from typing import List, Dict
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional, Iterator, Generator, Set
 from .base_fetcher import BaseFetcher
+from .http_client import HTTPClient
+from .fetch_state import FetchState
+import json
 import logging
 
 class NewsAPIFetcher(BaseFetcher):
     """Fetches articles from NewsAPI."""
     
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, http_client: Optional[HTTPClient] = None):
         """Initialize the NewsAPI fetcher with configuration."""
+        super().__init__(config, http_client)
         self.logger = logging.getLogger(__name__)
         
         # Get API key from config
@@ -23,6 +27,17 @@ class NewsAPIFetcher(BaseFetcher):
         self.language = news_api_config.get('language', 'en')
         self.sort_by = news_api_config.get('sort_by', 'publishedAt')
         self.max_articles = news_api_config.get('max_articles', 10)
+        self.max_pages = news_api_config.get('max_pages', 1)
+        self.history_days = news_api_config.get('history_days', 29)  # How far back the plan serves articles
+        
+        # Optionally remember the newest publishedAt seen so runs only fetch new articles,
+        # and the stretches a cut-short run left unread
+        self.fetch_state = None
+        if news_api_config.get('incremental', False):
+            self.fetch_state = FetchState(config.get('state', {}).get('db_path', 'posts.db'))
+        self.watermark_key = f"news_api:{self.language}:{self.query}"
+        self.boundary_key = f"{self.watermark_key}:boundary"
+        self.gaps_key = f"{self.watermark_key}:gaps"
         
         # Initialize the NewsAPI client
         # self.newsapi = NewsApiClient(api_key=self.api_key)  # This line is commented out because NewsApiClient is not imported
@@ -31,31 +46,200 @@ class NewsAPIFetcher(BaseFetcher):
 
     def fetch_articles(self) -> List[Dict]:
         try:
-            # Get articles from the last 24 hours
-            from_date = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+            articles = list(self.iter_articles())
+            self.logger.info(f"Fetched {len(articles)} articles from NewsAPI")
+            return articles
             
+        except requests.RequestException as e:
+            self.logger.error(f"Error fetching from NewsAPI: {str(e)}")
+            return []
+        except Exception as e:
+            self.logger.error(f"Unexpected error: {str(e)}")
+            return []
+
+    def iter_articles(self) -> Iterator[Dict]:
+        """
+        Yield articles page by page.
+        
+        In incremental mode only articles published since the stored
+        high-water mark are requested, and the mark advances to the newest
+        article read. Results come newest first, so a run cut short by the
+        page budget or the plan's result limit leaves a stretch between the
+        oldest article it read and the previous mark unread. That stretch is
+        stored as a gap and later runs spend their leftover pages filling it,
+        oldest gap first, with at least one page per run. Articles at a
+        range's end timestamps are told apart by URL.
+        
+        Ranges are clamped to the plan's history window, and a mark the API
+        still rejects is reset so the next run starts from the last day.
+        """
+        watermark, boundary_urls, gaps = None, set(), []
+        if self.fetch_state:
+            state = self.fetch_state.get_many([self.watermark_key, self.boundary_key, self.gaps_key])
+            watermark = state.get(self.watermark_key)
+            boundary_urls = set(json.loads(state.get(self.boundary_key) or '[]'))
+            gaps = json.loads(state.get(self.gaps_key) or '[]')
+        
+        # NewsAPI refuses ranges that start before the plan's history window
+        window_start = (datetime.now(timezone.utc) - timedelta(days=self.history_days)).strftime('%Y-%m-%dT%H:%M:%SZ')
+        if watermark and watermark < window_start:
+            self.logger.info(f"NewsAPI watermark {watermark} is older than the plan's history, starting from {window_start}")
+            watermark, boundary_urls = window_start, set()
+        saved_gaps = gaps
+        gaps = [
+            gap if gap['from'] >= window_start else {**gap, 'from': window_start, 'from_urls': []}
+            for gap in gaps if not gap['to'] or gap['to'] >= window_start
+        ]
+        
+        # Without a watermark, get articles from the last 24 hours
+        from_date = watermark or (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+        latest = yield from self._iter_range(from_date, None, boundary_urls, set(), self.max_pages)
+        # Gaps always get a page, so they are filled even when the latest articles use the whole budget
+        pages_left = max(1, self.max_pages - latest['pages'])
+        
+        remaining_gaps = []
+        for gap in gaps:
+            if pages_left <= 0:
+                remaining_gaps.append(gap)
+                continue
+            self.logger.info(f"Filling NewsAPI gap from {gap['from']} to {gap['to']}")
+            result = yield from self._iter_range(
+                gap['from'], gap['to'], set(gap['from_urls']), set(gap['to_urls']), pages_left
+            )
+            pages_left -= result['pages']
+            if not result['complete']:
+                narrowed = self._narrow_gap(gap, result)
+                if narrowed:
+                    remaining_gaps.append(narrowed)
+        
+        if not latest['complete'] and latest['oldest_seen']:
+            narrowed = self._narrow_gap(
+                {'from': from_date, 'from_urls': sorted(boundary_urls), 'to': None, 'to_urls': []}, latest
+            )
+            if narrowed:
+                remaining_gaps.append(narrowed)
+        
+        if not self.fetch_state:
+            return
+        
+        updates = {}
+        if latest['rejected']:
+            updates[self.watermark_key] = ''
+            updates[self.boundary_key] = '[]'
+        newest, newest_urls = latest['newest'], latest['newest_urls']
+        if newest and newest == watermark:
+            newest_urls |= boundary_urls
+        if newest and (watermark is None or newest > watermark or newest_urls != boundary_urls):
+            updates[self.watermark_key] = newest
+            updates[self.boundary_key] = json.dumps(sorted(newest_urls))
+        if remaining_gaps != saved_gaps:
+            updates[self.gaps_key] = json.dumps(remaining_gaps)
+            self.logger.info(f"{len(remaining_gaps)} NewsAPI gaps left to fill")
+        if updates:
+            self.fetch_state.set_many(updates)
+    
+    @staticmethod
+    def _narrow_gap(gap: Dict, result: Dict) -> Optional[Dict]:
+        """
+        The part of a gap below the oldest article a cut-short run read.
+        
+        Pages holding only end-of-range articles that were read before
+        yield nothing new, so the gap then ends one second before the oldest
+        of them instead of being requested the same way again. Returns None
+        when nothing of the gap is left.
+        """
+        if result['oldest'] is not None:
+            to_urls = set(result['oldest_urls'])
+            if result['oldest'] == gap['to']:
+                to_urls |= set(gap['to_urls'])
+            return dict(gap, to=result['oldest'], to_urls=sorted(to_urls))
+        
+        to_date = _second_before(result['oldest_seen']) if result['oldest_seen'] else None
+        if to_date is None or to_date < gap['from']:
+            return None
+        return dict(gap, to=to_date, to_urls=[])
+    
+    def _iter_range(self, from_date: str, to_date: Optional[str], from_urls: Set[str], to_urls: Set[str],
+                    max_pages: int) -> Generator[Dict, None, Dict]:
+        """
+        Yield the articles published between two timestamps, newest first.
+        
+        Both ends are inclusive, so articles at an end timestamp whose URLs
+        are listed for it are skipped. Returns the newest and oldest
+        timestamps read with the URLs at each, the oldest timestamp on the
+        pages including skipped articles, the number of pages requested,
+        whether the results were read to the end and whether the API
+        rejected the range outright.
+        """
+        page_size = min(self.max_articles, 100)  # Respect max_articles setting
+        result = {
+            'newest': None, 'newest_urls': set(), 'oldest': None, 'oldest_urls': set(),
+            'oldest_seen': None, 'pages': 0, 'complete': False, 'rejected': False
+        }
+        
+        for page in range(1, max_pages + 1):
             params = {
                 'q': self.query,
                 'from': from_date,
                 'sortBy': self.sort_by,
                 'language': self.language,
                 'apiKey': self.api_key,
-                'pageSize': min(self.max_articles, 100)  # Respect max_articles setting
+                'pageSize': page_size,
+                'page': page
             }
+            if to_date:
+                params['to'] = to_date
             
-            self.logger.info(f"Fetching articles about: {self.query}")
-            response = requests.get(self.base_url, params=params)
-            response.raise_for_status()
+            self.logger.info(f"Fetching articles about: {self.query} (page {page})")
+            response = self.http_client.get(self.base_url, params=params)
+            result['pages'] = page
             
-            articles = response.json().get('articles', [])
-            self.logger.info(f"Fetched {len(articles)} articles from NewsAPI")
+            # NewsAPI refuses pages beyond the plan's result limit, and ranges beyond its history
+            if response.status_code in (400, 426):
+                if page > 1:
+                    self.logger.info("NewsAPI result limit reached, stopping pagination")
+                else:
+                    self.logger.warning(f"NewsAPI rejected the range from {from_date} ({response.status_code})")
+                    result['rejected'] = True
+                break
+            response.raise_for_status()
             
-            return [self.format_article(article, article.get('source', {}).get('name', 'NewsAPI')) 
-                   for article in articles]
+            data = response.json()
+            articles = data.get('articles', [])
+            for article in articles:
+                published_at = article.get('publishedAt') or ''
+                url = article.get('url')
+                if published_at and (result['oldest_seen'] is None or published_at < result['oldest_seen']):
+                    result['oldest_seen'] = published_at
+                if published_at and (
+                    published_at < from_date or (published_at == from_date and url in from_urls)
+                    or (to_date and (published_at > to_date or (published_at == to_date and url in to_urls)))
+                ):
+                    continue
+                if published_at:
+                    if result['newest'] is None or published_at > result['newest']:
+                        result['newest'], result['newest_urls'] = published_at, set()
+                    if result['oldest'] is None or published_at < result['oldest']:
+                        result['oldest'], result['oldest_urls'] = published_at, set()
+                    if url and published_at == result['newest']:
+                        result['newest_urls'].add(url)
+                    if url and published_at == result['oldest']:
+                        result['oldest_urls'].add(url)
+                yield self.format_article(article, article.get('source', {}).get('name', 'NewsAPI'))
             
-        except requests.RequestException as e:
-            self.logger.error(f"Error fetching from NewsAPI: {str(e)}")
-            return []
-        except Exception as e:
-            self.logger.error(f"Unexpected error: {str(e)}")
-            return []
+            if len(articles) < page_size or page * page_size >= data.get('totalResults', 0):
+                result['complete'] = True
+                break
+        
+        return result
+
+
+def _second_before(timestamp: str) -> Optional[str]:
+    """The ``publishedAt`` timestamp one second earlier, or None if it can't be parsed."""
+    try:
+        moment = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return (moment.astimezone(timezone.utc) - timedelta(seconds=1)).strftime('%Y-%m-%dT%H:%M:%SZ')
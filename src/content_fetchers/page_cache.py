@@ -0,0 +1,94 @@
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+from typing import Any, Iterable, List, Optional
+
+# Parts of a page that change between requests without the listing changing
+VOLATILE_PATTERNS = [
+    rb'<!--.*?-->',
+    rb'<script(?![^>]*application/ld\+json)[^>]*>.*?</script>',  # JSON-LD is kept, it lists articles
+    rb'<style[^>]*>.*?</style>',
+    rb'<noscript[^>]*>.*?</noscript>',
+    rb'<iframe[^>]*>.*?</iframe>',
+    rb'<time[^>]*>.*?</time>',
+    rb'\s(?:nonce|data-timestamp|data-ad-[\w-]+|csrf[\w-]*)="[^"]*"',
+]
+
+class PageCache:
+    """
+    Persistent store of page content digests per URL.
+
+    Many sites send no usable validators, but their listing pages are often
+    unchanged between runs once scripts, ads and timestamps are ignored. The
+    digest of the normalized page is kept with the records extracted from
+    it, so an unchanged page is answered from the cache without parsing.
+    """
+
+    def __init__(self, db_path: str = "http_cache.db", ignore_patterns: Optional[List[str]] = None):
+        self.logger = logging.getLogger(__name__)
+        self.db_path = db_path
+        patterns = VOLATILE_PATTERNS + [pattern.encode('utf-8') for pattern in (ignore_patterns or [])]
+        self.volatile = re.compile(b'|'.join(b'(?:' + pattern + b')' for pattern in patterns), re.S | re.I)
+        self._init_db()
+
+    def _init_db(self):
+        """Initialize the database with required tables."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS page_cache (
+                        url TEXT PRIMARY KEY,
+                        digest TEXT,
+                        payload TEXT,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                conn.commit()
+        except Exception as e:
+            self.logger.error(f"Error initializing page cache: {str(e)}")
+            raise
+
+    def digest(self, content: bytes, context: Iterable[str] = ()) -> str:
+        """
+        Digest of a page with volatile parts stripped and whitespace collapsed.
+
+        ``context`` holds anything else the extracted records depend on,
+        such as the configured topics, so changing it invalidates the entry.
+        """
+        normalized = b' '.join(self.volatile.sub(b' ', content).split())
+        hasher = hashlib.blake2b(normalized, digest_size=16)
+        for value in context:
+            hasher.update(b'\0' + str(value).encode('utf-8'))
+        return hasher.hexdigest()
+
+    def get(self, url: str, digest: str) -> Optional[Any]:
+        """Get the records extracted from a URL if its content digest is unchanged."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT digest, payload FROM page_cache WHERE url = ?", (url,))
+                row = cursor.fetchone()
+        except Exception as e:
+            self.logger.error(f"Error reading page cache for {url}: {str(e)}")
+            return None
+
+        if not row or row[0] != digest or row[1] is None:
+            return None
+        return json.loads(row[1])
+
+    def store(self, url: str, digest: str, payload: Any):
+        """Store a page's content digest and the records extracted from it."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """INSERT OR REPLACE INTO page_cache (url, digest, payload, updated_at)
+                       VALUES (?, ?, ?, datetime('now'))""",
+                    (url, digest, json.dumps(payload))
+                )
+                conn.commit()
+        except Exception as e:
+            self.logger.error(f"Error writing page cache for {url}: {str(e)}")
@@ -0,0 +1,145 @@
+from typing import Dict, Optional
+from email.utils import parsedate_to_datetime
+import logging
+import threading
+import time
+
+REMAINING_HEADERS = ('X-RateLimit-Remaining', 'X-Rate-Limit-Remaining', 'RateLimit-Remaining')
+RESET_HEADERS = ('X-RateLimit-Reset', 'X-Rate-Limit-Reset', 'RateLimit-Reset')
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Callers reserve a token and are told how long to wait for it, so
+    concurrent callers queue up in order instead of polling. A bucket with
+    no rate is unlimited until a server tells it otherwise.
+    """
+
+    def __init__(self, rate: Optional[float] = None, burst: float = 1):
+        self.configured_rate = rate
+        self.rate = rate
+        self.capacity = max(1.0, float(burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def _refill(self, now: float):
+        if self.rate:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it."""
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait = max(0.0, self.paused_until - now)
+            if not self.rate:
+                return wait
+
+            self.tokens -= 1
+            if self.tokens < 0:
+                wait = max(wait, -self.tokens / self.rate)
+            return wait
+
+    def pause(self, seconds: float):
+        """Hold all requests for the given number of seconds."""
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def adapt(self, remaining: int, reset_in: float):
+        """Spread the requests the server still allows evenly over its window."""
+        if remaining <= 0 or reset_in <= 0:
+            return
+        with self.lock:
+            self._refill(time.monotonic())
+            server_rate = max(remaining, 0) / reset_in
+            self.rate = min(server_rate, self.configured_rate) if self.configured_rate else server_rate
+
+
+class RateLimiter:
+    """
+    Per-host token buckets shared by every request made through ``HTTPClient``.
+
+    Static limits come from configuration; they are then tightened or
+    relaxed from the rate-limit headers the server sends back.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, Dict]] = None):
+        self.logger = logging.getLogger(__name__)
+        self.buckets = {}
+        self.lock = threading.Lock()
+        for host, limit in (limits or {}).items():
+            self.configure(host, limit.get('rate'), limit.get('burst', 1))
+
+    def configure(self, host: str, rate: Optional[float], burst: float = 1):
+        """Set a static limit (requests per second) for a host."""
+        with self.lock:
+            self.buckets[host] = TokenBucket(rate, burst)
+
+    def _bucket(self, host: str) -> TokenBucket:
+        with self.lock:
+            if host not in self.buckets:
+                self.buckets[host] = TokenBucket()
+            return self.buckets[host]
+
+    def acquire(self, host: str):
+        """Block until a request to the host is allowed."""
+        wait = self._bucket(host).reserve()
+        if wait > 0:
+            self.logger.debug(f"Waiting {wait:.2f}s for rate limit on {host}")
+            time.sleep(wait)
+
+    def update(self, host: str, response):
+        """Adjust the host's bucket from a response's rate-limit headers."""
+        bucket = self._bucket(host)
+        headers = response.headers
+
+        if response.status_code in (429, 503):
+            retry_after = _parse_retry_after(headers.get('Retry-After'))
+            if retry_after is not None:
+                self.logger.warning(f"{host} asked to retry after {retry_after:.0f}s, pausing requests")
+                bucket.pause(retry_after)
+                return
+
+        remaining = _first_header(headers, REMAINING_HEADERS)
+        reset = _first_header(headers, RESET_HEADERS)
+        if remaining is None or reset is None:
+            return
+
+        try:
+            remaining = int(float(remaining))
+            reset = float(reset)
+        except ValueError:
+            return
+
+        # Reset is an epoch timestamp on some APIs and a delay in seconds on others
+        reset_in = reset - time.time() if reset > 1e9 else reset
+
+        if remaining <= 0 and reset_in > 0:
+            self.logger.warning(f"Rate limit exhausted for {host}, pausing for {reset_in:.0f}s")
+            bucket.pause(reset_in)
+        else:
+            bucket.adapt(remaining, reset_in)
+
+
+def _first_header(headers, names) -> Optional[str]:
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            return value
+    return None
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given either in seconds or as an HTTP date."""
+    if not value:
+        return None
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
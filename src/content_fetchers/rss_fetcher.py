@@ -1,14 +1,17 @@
-from typing import List, Dict
-import feedparser
+from typing import List, Dict, Optional, Iterator
 from datetime import datetime
 import logging
 from .base_fetcher import BaseFetcher
+from .http_client import HTTPClient
+from .feed_downloader import FeedDownloader, fetch_feed
+from .http_cache import HTTPCache
 
 class RSSFetcher(BaseFetcher):
     """Fetches articles from RSS feeds."""
     
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, http_client: Optional[HTTPClient] = None):
         """Initialize the RSS fetcher with configuration."""
+        super().__init__(config, http_client)
         self.logger = logging.getLogger(__name__)
         
         # Get RSS config
@@ -18,34 +21,77 @@ class RSSFetcher(BaseFetcher):
         
         if not self.feeds:
             raise ValueError("RSS feeds list is required")
-
+        
+        # Optionally revalidate feeds with conditional GETs instead of re-downloading them
+        self.http_cache = None
+        if rss_config.get('conditional_get', False):
+            self.http_cache = HTTPCache(config.get('cache', {}).get('http_cache_path', 'http_cache.db'))
+        
+        # Optionally download all feeds concurrently and parse them in a worker pool
+        self.downloader = None
+        if rss_config.get('parallel', False):
+            self.downloader = FeedDownloader(
+                max_concurrency=rss_config.get('max_concurrency', 8),
+                parse_workers=rss_config.get('parse_workers', 0),
+                cache=self.http_cache,
+                http_client=self.http_client
+            )
+    
+    def close(self):
+        """Shut down the feed parse workers."""
+        if self.downloader:
+            self.downloader.close()
+    
     def fetch_articles(self) -> List[Dict]:
         try:
-            all_articles = []
-            for feed_url in self.feeds:
-                self.logger.info(f"Fetching from RSS feed: {feed_url}")
-                feed = feedparser.parse(feed_url)
-                
-                feed_title = feed.feed.get('title', 'RSS Feed')
-                
-                # Process each entry up to the limit
-                for entry in feed.entries[:self.max_articles_per_feed]:
-                    article = {
-                        'title': entry.get('title', ''),
-                        'url': entry.get('link', ''),
-                        'summary': entry.get('summary', ''),
-                        'content': entry.get('content', [{}])[0].get('value', '') 
-                                 if 'content' in entry else entry.get('summary', ''),
-                        'date': entry.get('published', ''),
-                        'source': feed_title,
-                        'topic': 'artificial intelligence',
-                        'topic_hashtag': 'AI'
-                    }
-                    all_articles.append(self.format_article(article, feed_title))
-                
+            all_articles = list(self.iter_articles())
             self.logger.info(f"Fetched {len(all_articles)} articles from RSS feeds")
             return all_articles
-            
+        
         except Exception as e:
             self.logger.error(f"Error fetching from RSS feeds: {str(e)}")
             return []
+    
+    def iter_articles(self) -> Iterator[Dict]:
+        """Yield articles feed by feed as each feed becomes available."""
+        for feed in self._iter_feeds():
+            yield from self._process_feed(feed)
+    
+    def _iter_feeds(self) -> Iterator[Dict]:
+        """Yield parsed feeds, in completion order when downloading in parallel."""
+        if self.downloader:
+            self.logger.info(f"Fetching {len(self.feeds)} RSS feeds in parallel")
+            for feed_url, feed in self.downloader.iter_fetch(self.feeds):
+                yield feed
+            return
+        
+        for feed_url in self.feeds:
+            self.logger.info(f"Fetching from RSS feed: {feed_url}")
+            try:
+                feed = fetch_feed(feed_url, self.http_client, self.http_cache)
+            except Exception as e:
+                self.logger.error(f"Error fetching RSS feed {feed_url}: {str(e)}")
+                continue
+            yield feed
+    
+    def _process_feed(self, feed: Dict) -> List[Dict]:
+        """Format the entries of a parsed feed."""
+        articles = []
+        feed_title = feed['feed'].get('title', 'RSS Feed')
+        
+        # Process each entry up to the limit
+        for entry in feed['entries'][:self.max_articles_per_feed]:
+            article = {
+                'title': entry.get('title', ''),
+                'url': entry.get('link', ''),
+                'summary': entry.get('summary', ''),
+                'content': entry.get('content', [{}])[0].get('value', '')
+                         if 'content' in entry else entry.get('summary', ''),
+                'date': entry.get('published', ''),
+                'source': feed_title,
+                'topic': 'artificial intelligence',
+                'topic_hashtag': 'AI'
+            }
+            articles.append(self.format_article(article, feed_title))
+        
+        return articles
@@ -0,0 +1,177 @@
+from typing import Dict, Iterator, List, Optional
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from urllib.parse import urljoin
+import html
+import json
+import re
+from bs4 import SoupStrainer
+from .html_parser import parse_html
+
+ARTICLE_TYPES = {
+    'Article', 'NewsArticle', 'BlogPosting', 'ReportageNewsArticle',
+    'AnalysisNewsArticle', 'OpinionNewsArticle', 'TechArticle', 'Report'
+}
+
+FEED_TYPES = ('application/rss+xml', 'application/atom+xml')
+
+# Only these tags carry structured data, so nothing else needs to be built
+STRUCTURED_DATA_STRAINER = SoupStrainer(['script', 'meta', 'link'])
+
+_TAG_PATTERN = re.compile(r'<[^>]+>')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def normalize_date(value) -> Optional[str]:
+    """Convert an ISO 8601 or RFC 822 date to ``YYYY-MM-DD``."""
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).strftime('%Y-%m-%d')
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(value).strftime('%Y-%m-%d')
+    except (TypeError, ValueError):
+        pass
+    match = re.match(r'\d{4}-\d{2}-\d{2}', value)
+    return match.group() if match else None
+
+
+def html_to_text(value) -> str:
+    """Strip markup and collapse whitespace in a short HTML fragment."""
+    if not isinstance(value, str):
+        return ''
+    return _WHITESPACE_PATTERN.sub(' ', html.unescape(_TAG_PATTERN.sub(' ', value))).strip()
+
+
+def _types(node: Dict) -> List[str]:
+    node_type = node.get('@type', [])
+    return [node_type] if isinstance(node_type, str) else [t for t in node_type if isinstance(t, str)]
+
+
+def _walk_json_ld(data) -> Iterator[Dict]:
+    """Yield every object in a JSON-LD document, flattening lists and ``@graph``."""
+    if isinstance(data, list):
+        for item in data:
+            yield from _walk_json_ld(item)
+    elif isinstance(data, dict):
+        yield data
+        if '@graph' in data:
+            yield from _walk_json_ld(data['@graph'])
+
+
+def _node_url(node: Dict) -> str:
+    url = node.get('url') or node.get('mainEntityOfPage') or node.get('@id') or ''
+    if isinstance(url, dict):
+        url = url.get('@id') or url.get('url') or ''
+    if isinstance(url, list):
+        url = url[0] if url and isinstance(url[0], str) else ''
+    return url if isinstance(url, str) else ''
+
+
+def _article_from_node(node: Dict, base_url: str) -> Optional[Dict]:
+    """Build an article record from a JSON-LD article or list item."""
+    title = node.get('headline') or node.get('name')
+    url = _node_url(node)
+    if not isinstance(title, str) or not title.strip() or not url:
+        return None
+
+    summary = html_to_text(node.get('description'))
+    content = html_to_text(node.get('articleBody')) or summary
+    return {
+        'title': html_to_text(title),
+        'url': urljoin(base_url, url),
+        'date': normalize_date(node.get('datePublished') or node.get('dateCreated')),
+        'content': content,
+        'summary': summary
+    }
+
+
+def extract_json_ld(soup, base_url: str) -> List[Dict]:
+    """Articles described by JSON-LD ``Article``/``NewsArticle`` objects and ``ItemList``s."""
+    articles = []
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            data = json.loads(script.get_text())
+        except ValueError:
+            continue
+
+        for node in _walk_json_ld(data):
+            types = _types(node)
+            if ARTICLE_TYPES.intersection(types):
+                article = _article_from_node(node, base_url)
+                if article:
+                    articles.append(article)
+            elif 'ItemList' in types:
+                for element in node.get('itemListElement', []):
+                    if not isinstance(element, dict):
+                        continue
+                    item = element.get('item')
+                    if isinstance(item, dict):
+                        element = dict(element, **item)
+                    elif isinstance(item, str):
+                        element = dict(element, url=item)
+                    article = _article_from_node(element, base_url)
+                    if article:
+                        articles.append(article)
+    return articles
+
+
+def extract_opengraph(soup, base_url: str) -> Optional[Dict]:
+    """The article described by OpenGraph meta tags, if the page is an article."""
+    properties = {}
+    for meta in soup.find_all('meta'):
+        key = meta.get('property') or meta.get('name')
+        if key and key not in properties and meta.get('content'):
+            properties[key] = meta['content']
+
+    if properties.get('og:type') != 'article' or not properties.get('og:title'):
+        return None
+
+    summary = html_to_text(properties.get('og:description') or properties.get('description'))
+    return {
+        'title': html_to_text(properties['og:title']),
+        'url': urljoin(base_url, properties.get('og:url') or base_url),
+        'date': normalize_date(properties.get('article:published_time')),
+        'content': summary,
+        'summary': summary
+    }
+
+
+def find_feed_links(soup, base_url: str) -> List[str]:
+    """URLs of RSS/Atom feeds advertised with ``<link rel="alternate">``."""
+    feeds = []
+    for link in soup.find_all('link', href=True):
+        rel = link.get('rel') or []
+        rel = rel.split() if isinstance(rel, str) else rel
+        if 'alternate' in rel and (link.get('type') or '').lower() in FEED_TYPES:
+            feeds.append(urljoin(base_url, link['href']))
+    return feeds
+
+
+def extract_structured_data(html_content, base_url: str, parser: str = 'lxml') -> Dict:
+    """
+    Read the structured data a page publishes about its articles.
+
+    Only ``script``, ``meta`` and ``link`` tags are built. Returns the
+    articles found in JSON-LD (or OpenGraph, when the page is itself an
+    article), deduplicated by URL, and any advertised feed URLs.
+    """
+    soup = parse_html(html_content, parser, STRUCTURED_DATA_STRAINER)
+
+    articles = extract_json_ld(soup, base_url)
+    if not articles:
+        opengraph = extract_opengraph(soup, base_url)
+        if opengraph:
+            articles = [opengraph]
+
+    seen = set()
+    unique_articles = []
+    for article in articles:
+        if article['url'] not in seen:
+            seen.add(article['url'])
+            unique_articles.append(article)
+
+    return {'articles': unique_articles, 'feeds': find_feed_links(soup, base_url)}
@@ -1,110 +1,209 @@
-from typing import List, Dict
+from typing import Callable, List, Dict, Optional, Iterator
 import tweepy
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from .base_fetcher import BaseFetcher
-import time
+from .http_client import HTTPClient
+from .fetch_state import FetchState
+
+TWITTER_API_HOST = 'api.twitter.com'
+
+# Recent search only covers the last 7 days and rejects older since_ids; kept an hour inside it
+SEARCH_WINDOW = timedelta(days=7) - timedelta(hours=1)
+
+# Tweet ids are snowflakes carrying their creation time in milliseconds since this epoch
+TWITTER_EPOCH_MS = 1288834974657
+
+
+def tweet_time(tweet_id: str) -> datetime:
+    """Creation time encoded in a tweet id."""
+    return datetime.fromtimestamp(((int(tweet_id) >> 22) + TWITTER_EPOCH_MS) / 1000, tz=timezone.utc)
 
 class TwitterFetcher(BaseFetcher):
     """Fetches content from Twitter using Twitter API v2."""
     
-    def __init__(self, config: Dict):
-        super().__init__(config)
+    def __init__(self, config: Dict, http_client: Optional[HTTPClient] = None):
+        super().__init__(config, http_client)
         self.bearer_token = config.get('bearer_token')
         if not self.bearer_token:
             raise ValueError("Twitter bearer token is required")
         
         self.client = tweepy.Client(bearer_token=self.bearer_token, wait_on_rate_limit=True)
+        
+        # tweepy makes its own requests, so pace them through the shared limiter by hand
+        self.rate_limiter = self.http_client.rate_limiter
+        if config.get('requests_per_second'):
+            self.rate_limiter.configure(TWITTER_API_HOST, rate=config['requests_per_second'])
         self.search_queries = config.get('search_queries', ['#AI', '#MachineLearning'])
         self.accounts = config.get('accounts', [])
         self.max_results_per_query = 10  # Reduced to avoid rate limits
 
+        # since_id cursors and username -> id mappings persist between runs
+        self.fetch_state = FetchState(config.get('state_db_path', 'posts.db'))
+    
     def fetch_articles(self) -> List[Dict]:
         try:
-            all_tweets = []
-            
-            # Search for tweets with specific hashtags/keywords
-            for query in self.search_queries:
-                try:
-                    self.logger.info(f"Searching tweets for: {query}")
-                    tweets = self.client.search_recent_tweets(
-                        query=query,
-                        max_results=self.max_results_per_query,
-                        tweet_fields=['created_at', 'author_id', 'text', 'public_metrics']
-                    )
-                    
-                    if tweets and tweets.data:
-                        for tweet in tweets.data:
-                            # Skip tweets with low engagement
-                            metrics = getattr(tweet, 'public_metrics', {})
-                            if metrics and (metrics.get('retweet_count', 0) + metrics.get('like_count', 0)) < 5:
-                                continue
-                                
-                            article = {
-                                'title': f"Tweet about {query}",
-                                'url': f"https://twitter.com/user/status/{tweet.id}",
-                                'summary': tweet.text,
-                                'content': tweet.text,
-                                'date': tweet.created_at.isoformat() if tweet.created_at else datetime.now().isoformat(),
-                                'source': 'Twitter',
-                                'topic': query.replace('#', ''),
-                                'topic_hashtag': query.replace('#', '')
-                            }
-                            all_tweets.append(self.format_article(article, 'Twitter'))
-                    
-                    # Add delay between queries
-                    time.sleep(2)
-                    
-                except tweepy.TooManyRequests:
-                    self.logger.warning(f"Rate limit reached for query: {query}, moving to next source")
-                    break
-                except Exception as e:
-                    self.logger.error(f"Error fetching tweets for query {query}: {str(e)}")
-                    continue
-            
-            # Fetch tweets from specific accounts
-            for account in self.accounts:
-                try:
-                    self.logger.info(f"Fetching tweets from account: {account}")
-                    user = self.client.get_user(username=account)
-                    if user and user.data:
-                        tweets = self.client.get_users_tweets(
-                            id=user.data.id,
-                            max_results=self.max_results_per_query,
-                            tweet_fields=['created_at', 'text', 'public_metrics']
-                        )
-                        
-                        if tweets and tweets.data:
-                            for tweet in tweets.data:
-                                # Skip tweets with low engagement
-                                metrics = getattr(tweet, 'public_metrics', {})
-                                if metrics and (metrics.get('retweet_count', 0) + metrics.get('like_count', 0)) < 5:
-                                    continue
-                                    
-                                article = {
-                                    'title': f"Tweet by {account}",
-                                    'url': f"https://twitter.com/{account}/status/{tweet.id}",
-                                    'summary': tweet.text,
-                                    'content': tweet.text,
-                                    'date': tweet.created_at.isoformat() if tweet.created_at else datetime.now().isoformat(),
-                                    'source': f"Twitter - {account}",
-                                    'topic': 'artificial intelligence',
-                                    'topic_hashtag': 'AI'
-                                }
-                                all_tweets.append(self.format_article(article, f"Twitter - {account}"))
-                        
-                        # Add delay between accounts
-                        time.sleep(2)
-                        
-                except tweepy.TooManyRequests:
-                    self.logger.warning(f"Rate limit reached for account: {account}, moving to next source")
-                    break
-                except Exception as e:
-                    self.logger.error(f"Error fetching tweets from {account}: {str(e)}")
-                    continue
-            
+            all_tweets = list(self.iter_articles())
             self.logger.info(f"Fetched {len(all_tweets)} tweets")
             return all_tweets
             
         except Exception as e:
             self.logger.error(f"Error fetching from Twitter: {str(e)}")
             return []
+    
+    def _resolve_account_ids(self) -> Dict[str, str]:
+        """
+        Map configured usernames to user ids.
+        
+        Ids never change, so they are cached in the fetch state and only
+        unknown usernames are looked up, up to 100 per batched request.
+        """
+        keys = {account: f"twitter:user_id:{account.lower()}" for account in self.accounts}
+        cached = self.fetch_state.get_many(list(keys.values()))
+        account_ids = {account: cached[key] for account, key in keys.items() if key in cached}
+        
+        missing = [account for account in self.accounts if account not in account_ids]
+        for i in range(0, len(missing), 100):
+            batch = missing[i:i + 100]
+            self.logger.info(f"Looking up {len(batch)} Twitter accounts")
+            self.rate_limiter.acquire(TWITTER_API_HOST)
+            users = self.client.get_users(usernames=batch)
+            batch_accounts = {account.lower(): account for account in batch}
+            resolved = {}
+            for user in (users.data if users and users.data else []):
+                account = batch_accounts.get(user.username.lower())
+                if account:
+                    account_ids[account] = str(user.id)
+                    resolved[keys[account]] = str(user.id)
+            self.fetch_state.set_many(resolved)
+        
+        return account_ids
+    
+    def _advance_cursor(self, key: str, tweets):
+        """Store the newest tweet id seen so the next run starts after it."""
+        newest_id = (getattr(tweets, 'meta', None) or {}).get('newest_id')
+        if newest_id:
+            self.fetch_state.set(key, newest_id)
+    
+    def _get_with_cursor(self, key: str, request: Callable, window: Optional[timedelta] = None):
+        """
+        Make a request with the stored since_id cursor.
+        
+        A cursor older than ``window`` is left out, and one the API rejects
+        is cleared and the request repeated without it, so a stale cursor
+        never keeps failing the same query.
+        """
+        since_id = self.fetch_state.get(key) or None
+        if since_id and window and tweet_time(since_id) < datetime.now(timezone.utc) - window:
+            self.logger.info(f"Twitter cursor {key} is older than the search window, leaving it out")
+            since_id = None
+        
+        self.rate_limiter.acquire(TWITTER_API_HOST)
+        try:
+            return request(since_id)
+        except tweepy.BadRequest:
+            if not since_id:
+                raise
+            self.logger.warning(f"Twitter rejected cursor {key}, retrying without it")
+            self.fetch_state.set(key, '')
+            self.rate_limiter.acquire(TWITTER_API_HOST)
+            return request(None)
+    
+    def iter_articles(self) -> Iterator[Dict]:
+        """Yield tweets newer than the stored cursors, query by query and account by account."""
+        # Search for tweets with specific hashtags/keywords
+        for query in self.search_queries:
+            try:
+                self.logger.info(f"Searching tweets for: {query}")
+                cursor_key = f"twitter:since_id:query:{query}"
+                tweets = self._get_with_cursor(cursor_key, lambda since_id: self.client.search_recent_tweets(
+                    query=query,
+                    since_id=since_id,
+                    max_results=self.max_results_per_query,
+                    tweet_fields=['created_at', 'author_id', 'text', 'public_metrics']
+                ), SEARCH_WINDOW)
+                
+                if tweets and tweets.data:
+                    for tweet in tweets.data:
+                        # Skip tweets with low engagement
+                        metrics = getattr(tweet, 'public_metrics', {})
+                        if metrics and (metrics.get('retweet_count', 0) + metrics.get('like_count', 0)) < 5:
+                            continue
+                        
+                        article = {
+                            'title': f"Tweet about {query}",
+                            'url': f"https://twitter.com/user/status/{tweet.id}",
+                            'summary': tweet.text,
+                            'content': tweet.text,
+                            'date': tweet.created_at.isoformat() if tweet.created_at else datetime.now().isoformat(),
+                            'source': 'Twitter',
+                            'topic': query.replace('#', ''),
+                            'topic_hashtag': query.replace('#', '')
+                        }
+                        yield self.format_article(article, 'Twitter')
+                
+                self._advance_cursor(cursor_key, tweets)
+            
+            except tweepy.TooManyRequests:
+                self.logger.warning(f"Rate limit reached for query: {query}, moving to next source")
+                break
+            except Exception as e:
+                self.logger.error(f"Error fetching tweets for query {query}: {str(e)}")
+                continue
+        
+        if not self.accounts:
+            return
+        
+        try:
+            account_ids = self._resolve_account_ids()
+        except tweepy.TooManyRequests:
+            self.logger.warning("Rate limit reached while looking up accounts, skipping accounts")
+            return
+        except Exception as e:
+            self.logger.error(f"Error looking up Twitter accounts: {str(e)}")
+            return
+        
+        # Fetch tweets from specific accounts
+        for account in self.accounts:
+            user_id = account_ids.get(account)
+            if not user_id:
+                self.logger.warning(f"Twitter account not found: {account}")
+                continue
+            
+            try:
+                self.logger.info(f"Fetching tweets from account: {account}")
+                cursor_key = f"twitter:since_id:user:{user_id}"
+                tweets = self._get_with_cursor(cursor_key, lambda since_id: self.client.get_users_tweets(
+                    id=user_id,
+                    since_id=since_id,
+                    max_results=self.max_results_per_query,
+                    tweet_fields=['created_at', 'text', 'public_metrics']
+                ))
+                    
+                if tweets and tweets.data:
+                    for tweet in tweets.data:
+                        # Skip tweets with low engagement
+                        metrics = getattr(tweet, 'public_metrics', {})
+                        if metrics and (metrics.get('retweet_count', 0) + metrics.get('like_count', 0)) < 5:
+                            continue
+                                
+                        article = {
+                            'title': f"Tweet by {account}",
+                            'url': f"https://twitter.com/{account}/status/{tweet.id}",
+                            'summary': tweet.text,
+                            'content': tweet.text,
+                            'date': tweet.created_at.isoformat() if tweet.created_at else datetime.now().isoformat(),
+                            'source': f"Twitter - {account}",
+                            'topic': 'artificial intelligence',
+                            'topic_hashtag': 'AI'
+                        }
+                        yield self.format_article(article, f"Twitter - {account}")
+                    
+                self._advance_cursor(cursor_key, tweets)
+                    
+            except tweepy.TooManyRequests:
+                self.logger.warning(f"Rate limit reached for account: {account}, moving to next source")
+                break
+            except Exception as e:
+                self.logger.error(f"Error fetching tweets from {account}: {str(e)}")
+                continue
+            
\ No newline at end of file
@@ -0,0 +1,234 @@
+import base64
+import hashlib
+import logging
+import re
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from .http_client import HTTPClient
+
+# Query parameters that identify a campaign or click, not the page
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid',
+    'ref', 'ref_src', 'ref_url', 'cmpid', 'ncid', 'ocid', 'oc', 'spm', 'smid', 'sr_share'
+}
+TRACKING_PREFIXES = ('utm_', '_hs', 'mkt_', 'pk_', 'vero_')
+
+GOOGLE_NEWS_HOST = 'news.google.com'
+
+# Google News article pages carry the publisher URL in this attribute
+_GOOGLE_NEWS_TARGET_PATTERN = re.compile(r'data-n-au="([^"]+)"')
+
+
+def canonical_url(url: str) -> str:
+    """
+    Canonical form of a URL for deciding whether two URLs are one article.
+
+    The scheme becomes https, the host is lowercased without ``www.`` or a
+    default port, the fragment, tracking parameters and trailing slash are
+    dropped, and the remaining query parameters are sorted. A URL that
+    cannot be parsed, such as one with a non-numeric port, is returned
+    stripped but otherwise unchanged.
+    """
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+        host = (parts.hostname or '').removeprefix('www.')
+        port = parts.port
+    except ValueError:
+        return url
+    if port and port not in (80, 443):
+        host = f"{host}:{port}"
+
+    query = urlencode(sorted(
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name.lower() not in TRACKING_PARAMS and not name.lower().startswith(TRACKING_PREFIXES)
+    ))
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit(('https', host, path, query, ''))
+
+
+def url_key(url: str) -> int:
+    """64-bit key of a URL's canonical form, stored as a SQLite INTEGER."""
+    digest = hashlib.blake2b(canonical_url(url).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+
+def is_google_news_wrapper(url: str) -> bool:
+    """Whether a URL is a Google News redirect to a publisher's article."""
+    try:
+        parts = urlsplit(url)
+        return parts.hostname == GOOGLE_NEWS_HOST and '/articles/' in parts.path
+    except ValueError:
+        return False
+
+
+def decode_google_news_url(url: str) -> Optional[str]:
+    """
+    Publisher URL embedded in a Google News article id, without a request.
+
+    Older ids are base64 protobuf messages holding the URL as a
+    length-prefixed string. Newer ids are opaque and return None.
+    """
+    token = urlsplit(url).path.rstrip('/').rsplit('/', 1)[-1]
+    try:
+        data = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+    except (ValueError, TypeError):
+        return None
+    if not data.startswith(b'\x08\x13"'):
+        return None
+
+    # The string length is a protobuf varint
+    length, shift, position = 0, 0, 3
+    while position < len(data):
+        byte = data[position]
+        position += 1
+        length |= (byte & 0x7f) << shift
+        shift += 7
+        if not byte & 0x80:
+            break
+
+    link = data[position:position + length].decode('utf-8', errors='ignore')
+    return link if link.startswith(('http://', 'https://')) else None
+
+
+class ResolutionCache:
+    """
+    Persistent store of redirect wrapper URLs and the URLs they lead to.
+
+    Wrappers that could not be resolved are stored without a target, so
+    they aren't requested again until ``failure_ttl_hours`` have passed.
+    """
+
+    def __init__(self, db_path: str = "http_cache.db", failure_ttl_hours: int = 24):
+        self.logger = logging.getLogger(__name__)
+        self.db_path = db_path
+        self.failure_ttl_hours = failure_ttl_hours
+        self._init_db()
+
+    def _init_db(self):
+        """Initialize the database with required tables."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS url_resolutions (
+                        url TEXT PRIMARY KEY,
+                        resolved TEXT,
+                        resolved_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                conn.commit()
+        except Exception as e:
+            self.logger.error(f"Error initializing resolution cache: {str(e)}")
+            raise
+
+    def get_many(self, urls: List[str]) -> Dict[str, Optional[str]]:
+        """Get the cached resolutions for several URLs, with None for recent failures."""
+        resolved = {}
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                # Chunked to stay under SQLite's bound parameter limit
+                for start in range(0, len(urls), 500):
+                    chunk = urls[start:start + 500]
+                    placeholders = ','.join('?' * len(chunk))
+                    cursor.execute(
+                        f"""SELECT url, resolved FROM url_resolutions WHERE url IN ({placeholders})
+                            AND (resolved IS NOT NULL OR resolved_at > datetime('now', ?))""",
+                        chunk + [f'-{self.failure_ttl_hours} hours']
+                    )
+                    resolved.update(cursor.fetchall())
+        except Exception as e:
+            self.logger.error(f"Error reading resolution cache: {str(e)}")
+        return resolved
+
+    def store_many(self, resolutions: Dict[str, Optional[str]]):
+        """Store resolved URLs, with None for wrappers that could not be resolved."""
+        if not resolutions:
+            return
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.executemany(
+                    "INSERT OR REPLACE INTO url_resolutions (url, resolved, resolved_at) VALUES (?, ?, datetime('now'))",
+                    list(resolutions.items())
+                )
+                conn.commit()
+        except Exception as e:
+            self.logger.error(f"Error writing resolution cache: {str(e)}")
+
+
+class LinkResolver:
+    """
+    Replaces Google News redirect wrappers with the publisher URLs.
+
+    Ids that embed the URL are decoded locally and cached targets are looked
+    up in one query; neither needs a request. Opaque ids each need a request
+    to news.google.com, so only ``request_budget`` of them are requested per
+    run, with bounded concurrency, and the rest are tried on later runs.
+    Failures are cached for a while so a wrapper that doesn't resolve isn't
+    requested on every run.
+    """
+
+    def __init__(self, config: Optional[Dict] = None, http_client: Optional[HTTPClient] = None):
+        self.logger = logging.getLogger(__name__)
+        config = config or {}
+        self.http_client = http_client or HTTPClient.shared()
+        self.max_concurrency = max(1, config.get('max_concurrency', 4))
+        self.request_budget = config.get('request_budget', 20)
+        self.cache = ResolutionCache(config.get('cache_path', 'http_cache.db'), config.get('failure_ttl_hours', 24))
+
+    def _fetch_target(self, url: str) -> Optional[str]:
+        """Follow a wrapper's redirects or read its target from the page."""
+        try:
+            response = self.http_client.get(url)
+            response.raise_for_status()
+            if urlsplit(response.url).hostname != GOOGLE_NEWS_HOST:
+                return response.url
+            match = _GOOGLE_NEWS_TARGET_PATTERN.search(response.text)
+            return match.group(1) if match else None
+        except Exception as e:
+            self.logger.error(f"Error resolving {url}: {str(e)}")
+            return None
+
+    def lookup(self, urls: Iterable[str]) -> Tuple[Dict[str, str], List[str]]:
+        """
+        Resolve what can be resolved without a request.
+
+        Returns the targets found in the cache or decoded from the ids, and
+        the wrappers that would need a request, excluding recent failures.
+        """
+        wrappers = list(dict.fromkeys(url for url in urls if url and is_google_news_wrapper(url)))
+        if not wrappers:
+            return {}, []
+
+        cached = self.cache.get_many(wrappers)
+        resolved = {url: target for url, target in cached.items() if target}
+        decoded = {}
+        missing = []
+        for url in wrappers:
+            if url in cached:
+                continue
+            target = decode_google_news_url(url)
+            if target:
+                decoded[url] = target
+            else:
+                missing.append(url)
+
+        self.cache.store_many(decoded)
+        resolved.update(decoded)
+        return resolved, missing
+
+    def fetch(self, urls: List[str]) -> Dict[str, str]:
+        """Request wrappers' targets, caching successes and failures."""
+        if not urls:
+            return {}
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(urls))) as executor:
+            for url, target in zip(urls, executor.map(self._fetch_target, urls)):
+                results[url] = target
+        self.cache.store_many(results)
+        return {url: target for url, target in results.items() if target}
+
@@ -1,16 +1,26 @@
+import heapq
+import json
 import logging
-from typing import List, Dict
+from typing import List, Dict, Iterable, AsyncIterable, Optional, Set, Tuple
 import sqlite3
 from datetime import datetime, timedelta
+from content_fetchers.article_enricher import ArticleEnricher
+from content_fetchers.bm25_scorer import BM25Scorer, SCIPY_AVAILABLE
+from content_fetchers.http_client import HTTPClient
+from content_fetchers.keyword_matcher import KeywordMatcher
+from content_fetchers.near_duplicates import MinHashLSH, minhash
+from content_fetchers.structured_data import html_to_text
+from content_fetchers.url_canonicalizer import url_key
 
 class ContentFilter:
     """Filter and sort content based on relevance and criteria."""
     
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, http_client: Optional[HTTPClient] = None,
+                 keyword_matcher: Optional[KeywordMatcher] = None):
         """Initialize the content filter with configuration."""
         self.logger = logging.getLogger(__name__)
         self.config = config
-        self.db_path = "posts.db"
+        self.db_path = config.get('state', {}).get('db_path', 'posts.db')
         self._init_db()
         
         # Get filter config
@@ -18,10 +28,58 @@ class ContentFilter:
         self.min_relevance_score = filter_config.get('min_relevance_score', 0.5)
         self.max_articles = filter_config.get('max_articles', 3)
         self.keywords = filter_config.get('keywords', [])
+        self.recent_days = filter_config.get('recent_days', 30)
+        self.lookup_batch_size = filter_config.get('lookup_batch_size', 200)
         
         # Convert keywords to lowercase for case-insensitive matching
         self.keywords = [k.lower() for k in self.keywords]
+        self.keyword_matcher = keyword_matcher or KeywordMatcher(self.keywords)
+        
+        # Optionally rank the whole candidate set with field-weighted BM25 in one vectorized pass
+        batch_config = filter_config.get('batch_scoring', {})
+        self.batch_scorer = None
+        if batch_config.get('enabled', False):
+            if SCIPY_AVAILABLE:
+                self.batch_scorer = BM25Scorer(
+                    self.keyword_matcher,
+                    batch_config.get('field_weights'),
+                    k1=batch_config.get('k1', 1.2),
+                    b=batch_config.get('b', 0.75)
+                )
+            else:
+                self.logger.warning("NumPy/SciPy are not installed, scoring articles one at a time")
+        
+        # Optionally fetch full bodies for the best candidates and score them again
+        enrichment_config = filter_config.get('enrichment', {})
+        self.enricher = None
+        self.candidate_limit = self.max_articles
+        if enrichment_config.get('enabled', False):
+            self.enricher = ArticleEnricher(
+                {**enrichment_config, 'cache_path': config.get('cache', {}).get('http_cache_path', 'http_cache.db')},
+                http_client
+            )
+            self.candidate_limit = max(self.max_articles, enrichment_config.get('top_k', 10))
+        
+        # Optionally identify articles by a hashed canonical URL, so tracking parameters,
+        # scheme and trailing slash variants of a posted article aren't taken as new
+        self.canonical_urls = filter_config.get('canonical_urls', False)
+        if self.canonical_urls:
+            self._backfill_url_keys(self.recent_days)
+        
+        # Optionally keep recently posted URLs in memory so each check is a set lookup
+        self.recent_urls = None
+        if filter_config.get('recent_url_cache', False):
+            self.recent_urls = self._load_recent_urls(self.recent_days)
 
+        # Optionally collapse re-worded copies of the same story, including ones already posted
+        near_duplicate_config = filter_config.get('near_duplicates', {})
+        self.near_duplicate_threshold = None
+        if near_duplicate_config.get('enabled', False):
+            self.near_duplicate_threshold = near_duplicate_config.get('threshold', 0.6)
+            self.posted_fingerprints = MinHashLSH(self.near_duplicate_threshold)
+            for fingerprint in self._load_posted_fingerprints(self.recent_days):
+                self.posted_fingerprints.add(fingerprint)
+    
     def _init_db(self):
         """Initialize the database with required tables."""
         try:
@@ -45,24 +103,153 @@ class ContentFilter:
                     )
                 """)
                 
+                # Create posted_url_keys table, keyed on the hashed canonical URL
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS posted_url_keys (
+                        url_key INTEGER PRIMARY KEY,
+                        url TEXT,
+                        posted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                
+                # Create posted_fingerprints table
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS posted_fingerprints (
+                        url TEXT PRIMARY KEY,
+                        fingerprint TEXT,
+                        posted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                
                 conn.commit()
         except Exception as e:
             self.logger.error(f"Error initializing database: {str(e)}")
             raise
 
+    def history_key(self, url: str):
+        """Key a URL is deduplicated and looked up in the posting history by."""
+        return url_key(url) if self.canonical_urls else url
+    
+    def _history_source(self):
+        """Table and column holding the keys of posted articles."""
+        return ('posted_url_keys', 'url_key') if self.canonical_urls else ('posted_urls', 'url')
+    
+    def _backfill_url_keys(self, days: int = 30):
+        """Add canonical keys for recently posted URLs that were stored without one."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """SELECT url, posted_at FROM posted_urls
+                       WHERE posted_at > datetime('now', ?) AND url NOT IN (SELECT url FROM posted_url_keys)""",
+                    (f'-{days} days',)
+                )
+                rows = [(url_key(url), url, posted_at) for url, posted_at in cursor.fetchall()]
+                if rows:
+                    cursor.executemany(
+                        "INSERT OR IGNORE INTO posted_url_keys (url_key, url, posted_at) VALUES (?, ?, ?)",
+                        rows
+                    )
+                    conn.commit()
+        except Exception as e:
+            self.logger.error(f"Error backfilling URL keys: {str(e)}")
+    
+    def _load_recent_urls(self, days: int = 30) -> Set:
+        """Load the history keys of URLs posted in the last N days."""
+        table, column = self._history_source()
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    f"SELECT {column} FROM {table} WHERE posted_at > datetime('now', ?)",
+                    (f'-{days} days',)
+                )
+                return {row[0] for row in cursor.fetchall()}
+        except Exception as e:
+            self.logger.error(f"Error loading recent URLs: {str(e)}")
+            return set()
+    
+    def _urls_posted_recently(self, urls: List[str], days: int = 30) -> Set[str]:
+        """Check a batch of URLs over one connection, returning those posted in the last N days."""
+        keys = {url: self.history_key(url) for url in urls}
+        if self.recent_urls is not None:
+            return {url for url, key in keys.items() if key in self.recent_urls}
+        
+        table, column = self._history_source()
+        lookup = list(set(keys.values()))
+        posted = set()
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                # Chunked to stay under SQLite's bound parameter limit
+                for start in range(0, len(lookup), 500):
+                    chunk = lookup[start:start + 500]
+                    placeholders = ','.join('?' * len(chunk))
+                    cursor.execute(
+                        f"SELECT {column} FROM {table} WHERE {column} IN ({placeholders}) AND posted_at > datetime('now', ?)",
+                        chunk + [f'-{days} days']
+                    )
+                    posted.update(row[0] for row in cursor.fetchall())
+        except Exception as e:
+            self.logger.error(f"Error checking URL status: {str(e)}")
+        return {url for url, key in keys.items() if key in posted}
+    
     def _was_url_posted_recently(self, url: str, days: int = 30) -> bool:
         """Check if a URL was posted in the last N days."""
+        key = self.history_key(url)
+        if self.recent_urls is not None:
+            return key in self.recent_urls
+        table, column = self._history_source()
         try:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
                 cursor.execute(
-                    "SELECT 1 FROM posted_urls WHERE url = ? AND posted_at > datetime('now', ?)",
-                    (url, f'-{days} days')
+                    f"SELECT 1 FROM {table} WHERE {column} = ? AND posted_at > datetime('now', ?)",
+                    (key, f'-{days} days')
                 )
                 return cursor.fetchone() is not None
         except Exception as e:
             self.logger.error(f"Error checking URL status: {str(e)}")
             return False
+    
+    def _load_posted_fingerprints(self, days: int = 30) -> List[Tuple[int, ...]]:
+        """Load the story fingerprints of articles posted in the last N days."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT fingerprint FROM posted_fingerprints WHERE posted_at > datetime('now', ?)",
+                    (f'-{days} days',)
+                )
+                return [tuple(json.loads(row[0])) for row in cursor.fetchall()]
+        except Exception as e:
+            self.logger.error(f"Error loading posted fingerprints: {str(e)}")
+            return []
+    
+    def _mark_fingerprint_posted(self, article: Dict):
+        """Remember a posted article's story fingerprint."""
+        fingerprint = self.story_fingerprint(article)
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "INSERT OR REPLACE INTO posted_fingerprints (url, fingerprint, posted_at) VALUES (?, ?, datetime('now'))",
+                    (article['url'], json.dumps(fingerprint))
+                )
+                conn.commit()
+            self.posted_fingerprints.add(fingerprint)
+        except Exception as e:
+            self.logger.error(f"Error storing posted fingerprint: {str(e)}")
+    
+    @staticmethod
+    def story_fingerprint(article: Dict) -> Tuple[int, ...]:
+        """
+        MinHash signature of an article's title and summary text.
+        
+        Summaries can be HTML, like Google News descriptions, whose markup
+        would otherwise make unrelated stories look alike.
+        """
+        return minhash(f"{html_to_text(article.get('title'))} {html_to_text(article.get('summary'))}")
 
     def _mark_url_posted(self, url: str, title: str):
         """Mark a URL as posted."""
@@ -73,75 +260,270 @@ class ContentFilter:
                     "INSERT OR REPLACE INTO posted_urls (url, title, posted_at) VALUES (?, ?, datetime('now'))",
                     (url, title)
                 )
+                if self.canonical_urls:
+                    cursor.execute(
+                        "INSERT OR REPLACE INTO posted_url_keys (url_key, url, posted_at) VALUES (?, ?, datetime('now'))",
+                        (url_key(url), url)
+                    )
                 conn.commit()
+            if self.recent_urls is not None:
+                self.recent_urls.add(self.history_key(url))
         except Exception as e:
             self.logger.error(f"Error marking URL as posted: {str(e)}")
 
     def filter_articles(self, articles: List[Dict]) -> List[Dict]:
         """Filter and sort articles by relevance."""
+        return self.filter_article_stream(articles)
+    
+    def filter_article_stream(self, articles: Iterable[Dict]) -> List[Dict]:
+        """
+        Filter and sort articles by relevance as they arrive.
+        
+        Articles can come from a generator that is still fetching. Each one
+        is scored on arrival and only the current top N are kept, so memory
+        stays bounded by ``max_articles`` rather than by the number fetched.
+        Batch scoring needs statistics of the whole candidate set, so with it
+        every deduplicated article is held until the stream ends.
+        """
         try:
-            if not articles:
-                return []
-            
-            # First, filter out recently posted URLs
-            unposted_articles = []
+            selector = _TopKSelector(self)
             for article in articles:
-                url = article.get('url')
-                if url and not self._was_url_posted_recently(url):
-                    unposted_articles.append(article)
-            
-            if not unposted_articles:
-                self.logger.info("All articles have been posted recently")
-                return []
-            
-            # Calculate relevance scores for unposted articles
-            scored_articles = []
-            for article in unposted_articles:
-                score = self.calculate_relevance_score(article)
-                if score >= self.min_relevance_score:
-                    article['relevance_score'] = score
-                    scored_articles.append(article)
-            
-            # Sort by relevance score
-            scored_articles.sort(key=lambda x: x['relevance_score'], reverse=True)
-            
-            # Take top N articles
-            filtered_articles = scored_articles[:self.max_articles]
-            
-            # Mark the top article as posted
-            if filtered_articles:
-                top_article = filtered_articles[0]
-                self._mark_url_posted(top_article['url'], top_article['title'])
-            
-            self.logger.info(f"Filtered {len(articles)} articles down to {len(filtered_articles)} unposted articles")
-            if filtered_articles:
-                self.logger.info(f"Top article score: {filtered_articles[0]['relevance_score']}")
-            
-            return filtered_articles
+                selector.offer(article)
+            return self._finish_selection(selector)
             
         except Exception as e:
             self.logger.error(f"Error filtering articles: {str(e)}")
             return []
+    
+    async def afilter_article_stream(self, articles: AsyncIterable[Dict]) -> List[Dict]:
+        """Async variant of ``filter_article_stream``."""
+        try:
+            selector = _TopKSelector(self)
+            async for article in articles:
+                selector.offer(article)
+            return self._finish_selection(selector)
+        
+        except Exception as e:
+            self.logger.error(f"Error filtering articles: {str(e)}")
+            return []
+    
+    def _finish_selection(self, selector: '_TopKSelector') -> List[Dict]:
+        """Take the selected articles and mark the top one as posted."""
+        filtered_articles = selector.results()
+        if self.enricher and filtered_articles:
+            filtered_articles = self._rescore_enriched(filtered_articles)
+        
+        if selector.seen and not filtered_articles:
+            self.logger.info("No unposted articles passed filtering")
+            return []
+        
+        # Mark the top article as posted
+        if filtered_articles:
+            top_article = filtered_articles[0]
+            self._mark_url_posted(top_article['url'], top_article['title'])
+            if self.near_duplicate_threshold is not None:
+                self._mark_fingerprint_posted(top_article)
+        
+        if selector.near_duplicates:
+            self.logger.info(f"Collapsed {selector.near_duplicates} near-duplicate articles")
+        self.logger.info(f"Filtered {selector.seen} articles down to {len(filtered_articles)} unposted articles")
+        if filtered_articles:
+            self.logger.info(f"Top article score: {filtered_articles[0]['relevance_score']}")
+        
+        return filtered_articles
+    
+    def _rescore_enriched(self, candidates: List[Dict]) -> List[Dict]:
+        """
+        Fetch full bodies for the first-pass candidates and rank them again.
+        
+        Only the top candidates by the cheap first-pass score are enriched,
+        so a handful of pages are downloaded per run.
+        """
+        self.enricher.enrich(candidates)
+        for article, score in zip(candidates, self.score_articles(candidates)):
+            article['relevance_score'] = score
+        
+        # Stable sort keeps first-pass order for ties
+        candidates = sorted(candidates, key=lambda article: article['relevance_score'], reverse=True)
+        return [article for article in candidates if self.meets_min_relevance(article)][:self.max_articles]
+
+    def meets_min_relevance(self, article: Dict) -> bool:
+        """
+        Whether an article's flat keyword score reaches ``min_relevance_score``.
+        
+        BM25 scores shrink as keywords become common across the batch, so
+        they only order articles and this floor decides which ones pass.
+        """
+        return self.calculate_relevance_score(article) >= self.min_relevance_score
 
+    def score_articles(self, articles: List[Dict]) -> List[float]:
+        """Score several articles, with BM25 against the last batch when batch scoring is on."""
+        if self.batch_scorer is not None:
+            return self.batch_scorer.score(articles)
+        return [self.calculate_relevance_score(article) for article in articles]
+    
     def calculate_relevance_score(self, article: Dict) -> float:
         """Calculate relevance score for an article."""
         score = 0.0
         
-        # Get article text
-        title = article.get('title', '').lower()
-        summary = article.get('summary', '').lower()
-        content = article.get('content', '').lower()
+        # Find keywords in each field in one pass
+        title_hits = self.keyword_matcher.find(article.get('title', ''))
+        summary_hits = self.keyword_matcher.find(article.get('summary', ''))
+        content_hits = self.keyword_matcher.find(article.get('content', ''))
         
-        # Check title for keywords
-        for keyword in self.keywords:
-            if keyword in title:
-                score += 2.0  # Title matches are worth more
-            if keyword in summary:
-                score += 1.0
-            if keyword in content:
-                score += 0.5
+        # Title matches are worth more
+        score += 2.0 * len(title_hits)
+        score += 1.0 * len(summary_hits)
+        score += 0.5 * len(content_hits)
         
         # Normalize score
         score = min(score, 5.0)  # Cap at 5.0
         
         return score
+
+
+class _TopKSelector:
+    """
+    Keeps the best N unposted articles seen so far in a bounded min-heap.
+    
+    Articles that would make the current cut are queued and checked against
+    the posting history in batches, one query per batch, before entering
+    the heap. The heap only holds checked articles, so the cut used to
+    queue candidates is never higher than the true one.
+    
+    With batch scoring, articles that pass the flat relevance floor are
+    collected instead and ranked together when the results are taken, since
+    BM25 needs statistics of the whole set.
+    
+    Near-duplicate copies of a story are represented by the best-scoring
+    one, the longer copy on a tie, whatever order they arrive in. A better
+    copy replaces the one selected so far.
+    """
+    
+    def __init__(self, content_filter: ContentFilter):
+        self.content_filter = content_filter
+        self.limit = content_filter.candidate_limit
+        self.batch_size = max(1, content_filter.lookup_batch_size)
+        self.heap = []
+        self.pending = []
+        self.seen_urls = set()
+        self.seen = 0
+    
+        # Stories seen in this batch, and the best copy of each so far by story id
+        self.stories = None
+        self.representatives = {}
+        self.near_duplicates = 0
+        if content_filter.near_duplicate_threshold is not None:
+            self.stories = MinHashLSH(content_filter.near_duplicate_threshold)
+        
+        # Deduplicated articles waiting to be scored as one batch
+        self.batch = [] if content_filter.batch_scorer is not None else None
+    
+    def offer(self, article: Dict):
+        """Score an article and keep it if it makes the current top N."""
+        self.seen += 1
+        url = article.get('url')
+        if not url or self.limit <= 0:
+            return
+        key = self.content_filter.history_key(url)
+        if key in self.seen_urls:
+            return
+        self.seen_urls.add(key)
+        
+        score = self.content_filter.calculate_relevance_score(article)
+        if self.stories is not None and not self._represents_story(article, score):
+            self.near_duplicates += 1
+            return
+        
+        if score < self.content_filter.min_relevance_score:
+            return
+        if self.batch is not None:
+            self.batch.append((self.seen, article))
+            return
+        self._consider(article, score, self.seen)
+    
+    def _consider(self, article: Dict, score: float, order: int):
+        """Queue a scored article if it makes the current top N."""
+        # Earlier articles win ties, matching a stable sort of the full list
+        key = (score, -order)
+        if not self._makes_cut(key):
+            return
+        
+        # Only articles that would make the cut need the posted-history lookup
+        article['relevance_score'] = score
+        self.pending.append((score, -order, article))
+        if len(self.pending) >= self.batch_size:
+            self._flush()
+    
+    def _score_batch(self):
+        """Score the collected articles together and select from them."""
+        batch, self.batch = self.batch, []
+        if not batch:
+            return
+        scores = self.content_filter.batch_scorer.score_batch([article for _, article in batch])
+        for (order, article), score in zip(batch, scores):
+            self._consider(article, score, order)
+    
+    def _represents_story(self, article: Dict, score: float) -> bool:
+        """
+        Whether the article is the best copy of its story so far.
+        
+        Stories already posted have no representative. A copy that beats
+        the current representative withdraws it from the selection.
+        """
+        fingerprint = ContentFilter.story_fingerprint(article)
+        if self.content_filter.posted_fingerprints.find(fingerprint) is not None:
+            return False
+        
+        rank = (score, len(article.get('content') or '') + len(article.get('summary') or ''))
+        story = self.stories.find(fingerprint)
+        if story is None:
+            story = len(self.representatives)
+        else:
+            best_rank, best = self.representatives[story]
+            if rank <= best_rank:
+                return False
+            self.near_duplicates += 1
+            self._withdraw(best)
+        
+        # Later copies are matched against every copy that represented the story
+        self.stories.add(fingerprint, story)
+        self.representatives[story] = (rank, article)
+        return True
+    
+    def _withdraw(self, article: Dict):
+        """Remove an article from the batch, the lookup queue and the heap."""
+        if self.batch is not None:
+            self.batch = [entry for entry in self.batch if entry[1] is not article]
+            return
+        self.pending = [entry for entry in self.pending if entry[2] is not article]
+        heap = [entry for entry in self.heap if entry[2] is not article]
+        if len(heap) < len(self.heap):
+            heapq.heapify(heap)
+            self.heap = heap
+    
+    def _makes_cut(self, key) -> bool:
+        return len(self.heap) < self.limit or key > self.heap[0][:2]
+    
+    def _flush(self):
+        """Check the queued candidates in one lookup and push the unposted ones."""
+        if not self.pending:
+            return
+        pending, self.pending = self.pending, []
+        posted = self.content_filter._urls_posted_recently(
+            [entry[2]['url'] for entry in pending], self.content_filter.recent_days
+        )
+        for entry in pending:
+            if entry[2]['url'] in posted or not self._makes_cut(entry[:2]):
+                continue
+            if len(self.heap) < self.limit:
+                heapq.heappush(self.heap, entry)
+            else:
+                heapq.heapreplace(self.heap, entry)
+    
+    def results(self) -> List[Dict]:
+        """Selected articles, best first."""
+        if self.batch:
+            self._score_batch()
+        self._flush()
+        return [entry[2] for entry in sorted(self.heap, key=lambda entry: entry[:2], reverse=True)]
@@ -1,11 +1,16 @@
 import logging
+import queue
+import tempfile
+import threading
+import time
 import yaml
-from typing import Dict, List
+from typing import Dict, List, Iterator
 from datetime import datetime
 from dotenv import load_dotenv
 import os
 
 from content_fetchers import (
+    HTTPClient,
     NewsAPIFetcher,
     GoogleNewsFetcher,
     RSSFetcher,
@@ -13,7 +18,9 @@ from content_fetchers import (
     MediumFetcher,
     DevToFetcher
 )
+from content_fetchers.keyword_matcher import KeywordMatcher
 from content_filter import ContentFilter
+from scraper import WebScraper
 from linkedin_poster import LinkedInPoster
 from database import Database
 
@@ -35,47 +42,68 @@ class ContentBot:
         
         # Initialize components
         self.logger.info("Initializing content fetchers...")
+        self.http_client = HTTPClient(self.config.get('http', {}))
+        
+        # Recording starts from empty caches so every response is requested and saved, and
+        # replays read and write posting history, fetch cursors and caches in fresh databases,
+        # so every replay of the same fixtures starts from the same state
+        self.fixture_db_paths = []
+        if self.http_client.fixture_mode in ('record', 'replay'):
+            self.config.setdefault('cache', {})['http_cache_path'] = self._fixture_db('cache')
+            if self.http_client.fixture_mode == 'replay':
+                self.config.setdefault('state', {})['db_path'] = self._fixture_db('state')
+            self.logger.info(f"Running in {self.http_client.fixture_mode} mode with empty databases")
+        state_db_path = self.config.get('state', {}).get('db_path', 'posts.db')
+        
         self.fetchers = []
+        self.fetcher_threads = {}
+        self.fetcher_started = {}
         
         if self.config.get('sources', {}).get('news_api', {}).get('enabled', False):
-            self.fetchers.append(NewsAPIFetcher(self.config))
+            self.fetchers.append(NewsAPIFetcher(self.config, self.http_client))
             self.logger.info("Initialized news_api fetcher")
             
         if self.config.get('sources', {}).get('google_news', {}).get('enabled', False):
-            self.fetchers.append(GoogleNewsFetcher(self.config))
+            self.fetchers.append(GoogleNewsFetcher(self.config, self.http_client))
             self.logger.info("Initialized google_news fetcher")
             
         if self.config.get('sources', {}).get('rss', {}).get('enabled', False):
-            self.fetchers.append(RSSFetcher(self.config))
+            self.fetchers.append(RSSFetcher(self.config, self.http_client))
             self.logger.info("Initialized rss fetcher")
         
+        # One keyword matcher scores articles for both the scraper and the filter
+        self.keyword_matcher = KeywordMatcher.from_config(self.config)
+        
+        if self.config.get('scraping', {}).get('enabled', False):
+            scraping_config = {
+                **self.config['scraping'],
+                'cache_path': self.config.get('cache', {}).get('http_cache_path', 'http_cache.db'),
+                'state_db_path': state_db_path
+            }
+            self.fetchers.append(WebScraper(scraping_config, self.http_client, self.keyword_matcher))
+            self.logger.info("Initialized web scraper")
+        
         self.logger.info("Initializing other components...")
-        self.content_filter = ContentFilter(self.config)
+        self.content_filter = ContentFilter(self.config, self.http_client, self.keyword_matcher)
         
         self.logger.info("All components initialized successfully")
 
+    def _fixture_db(self, name: str) -> str:
+        """Create an empty temporary database file, removed when the bot exits."""
+        handle, path = tempfile.mkstemp(prefix=f'{self.http_client.fixture_mode}_{name}_', suffix='.db')
+        os.close(handle)
+        self.fixture_db_paths.append(path)
+        return path
+
     def run(self):
         """Run the content bot."""
         try:
             self.logger.info("Starting content bot...")
             
-            # Step 1: Fetch articles from all sources
+            # Steps 1 & 2: Fetch articles from all sources and filter them as they arrive
             self.logger.info("Step 1: Fetching articles from all sources...")
-            all_articles = []
-            
-            for fetcher in self.fetchers:
-                try:
-                    articles = fetcher.fetch_articles()
-                    self.logger.info(f"Fetched {len(articles)} articles from {fetcher.__class__.__name__}")
-                    all_articles.extend(articles)
-                except Exception as e:
-                    self.logger.error(f"Error fetching from {fetcher.__class__.__name__}: {str(e)}")
-            
-            self.logger.info(f"Total articles fetched: {len(all_articles)}")
-            
-            # Step 2: Filter content
-            self.logger.info("Step 2: Filtering content...")
-            filtered_articles = self.content_filter.filter_articles(all_articles)
+            self.logger.info("Step 2: Filtering content as articles arrive...")
+            filtered_articles = self.content_filter.filter_article_stream(self._stream_all_articles())
             self.logger.info(f"Filtered down to {len(filtered_articles)} articles")
             
             if not filtered_articles:
@@ -108,13 +136,156 @@ class ContentBot:
             except Exception as e:
                 self.logger.warning(f"Error cleaning up browser processes: {str(e)}")
 
+    def _stream_all_articles(self) -> Iterator[Dict]:
+        """Run all fetchers concurrently and yield articles as they arrive.
+
+        Each fetcher gets its own deadline (``fetching.fetcher_timeout``) measured
+        from when it starts, and the whole stage is bounded by
+        ``fetching.global_timeout``. Articles a fetcher produced before its
+        deadline are kept; after that it is asked to stop at its next article.
+        Fetchers run on daemon threads, so one stuck in a request past its
+        deadline is left behind instead of holding up interpreter exit.
+        """
+        if not self.fetchers:
+            return
+
+        fetch_config = self.config.get('fetching', {})
+        max_workers = fetch_config.get('max_workers', len(self.fetchers))
+        fetcher_timeout = fetch_config.get('fetcher_timeout', 60)
+        global_timeout = fetch_config.get('global_timeout', 120)
+
+        # Bounded so fetchers can't run far ahead of the filter
+        results = queue.Queue(maxsize=fetch_config.get('queue_size', 256))
+        stop_events = {fetcher: threading.Event() for fetcher in self.fetchers}
+        started = self.fetcher_started = {}
+        finished = object()
+        
+        def put(item, stop: threading.Event) -> bool:
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        # At most max_workers fetchers run at once; the rest wait for a slot
+        slots = threading.Semaphore(max(1, max_workers))
+
+        def run_fetcher(fetcher):
+            stop = stop_events[fetcher]
+            with slots:
+                if stop.is_set():
+                    return
+                started[fetcher] = time.monotonic()
+                try:
+                    for article in fetcher.iter_articles():
+                        if not put((fetcher, article), stop):
+                            return
+                except Exception as e:
+                    self.logger.error(f"Error fetching from {fetcher.__class__.__name__}: {str(e)}")
+                finally:
+                    put((fetcher, finished), stop)
+
+        for fetcher in self.fetchers:
+            thread = threading.Thread(
+                target=run_fetcher, args=(fetcher,),
+                name=f"fetcher-{fetcher.__class__.__name__}", daemon=True
+            )
+            self.fetcher_threads[fetcher] = thread
+            thread.start()
+        
+        active = set(self.fetchers)
+        counts = {fetcher: 0 for fetcher in self.fetchers}
+        global_deadline = time.monotonic() + global_timeout
+
+        try:
+            while active:
+                now = time.monotonic()
+
+                # Stop fetchers that have exceeded their own deadline
+                for fetcher in list(active):
+                    if fetcher in started and now - started[fetcher] >= fetcher_timeout:
+                        self.logger.warning(
+                            f"{fetcher.__class__.__name__} exceeded {fetcher_timeout}s deadline, "
+                            f"keeping {counts[fetcher]} articles"
+                        )
+                        stop_events[fetcher].set()
+                        active.discard(fetcher)
+
+                if not active:
+                    break
+
+                if now >= global_deadline:
+                    for fetcher in active:
+                        self.logger.warning(
+                            f"{fetcher.__class__.__name__} did not finish before global deadline, "
+                            f"keeping {counts[fetcher]} articles"
+                        )
+                    break
+
+                next_deadline = global_deadline
+                for fetcher in active:
+                    if fetcher in started:
+                        next_deadline = min(next_deadline, started[fetcher] + fetcher_timeout)
+
+                try:
+                    fetcher, article = results.get(timeout=max(0.0, next_deadline - now))
+                except queue.Empty:
+                    continue
+
+                if fetcher not in active:
+                    continue
+                
+                if article is finished:
+                    self.logger.info(f"Fetched {counts[fetcher]} articles from {fetcher.__class__.__name__}")
+                    active.discard(fetcher)
+                    continue
+                
+                counts[fetcher] += 1
+                yield article
+        finally:
+            for stop in stop_events.values():
+                stop.set()
+            self.logger.info(f"Total articles fetched: {sum(counts.values())}")
+
     def __enter__(self):
         """Support context manager protocol."""
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Clean up resources when exiting context."""
-        pass
+        """Clean up resources when exiting context.
+        
+        Stopped fetchers get ``fetching.shutdown_grace`` seconds to return
+        from their current request. A fetcher still running after that keeps
+        its own resources and the shared HTTP client open.
+        """
+        grace_deadline = time.monotonic() + self.config.get('fetching', {}).get('shutdown_grace', 5)
+        busy = set()
+        for fetcher, thread in self.fetcher_threads.items():
+            # One still waiting for a slot returns without fetching once it gets one
+            if fetcher not in self.fetcher_started:
+                continue
+            thread.join(max(0.0, grace_deadline - time.monotonic()))
+            if thread.is_alive():
+                self.logger.warning(f"{fetcher.__class__.__name__} is still running, leaving its resources open")
+                busy.add(fetcher)
+        
+        for fetcher in self.fetchers:
+            if fetcher in busy:
+                continue
+            try:
+                fetcher.close()
+            except Exception as e:
+                self.logger.warning(f"Error closing {fetcher.__class__.__name__}: {str(e)}")
+        if not busy:
+            self.http_client.close()
+        
+        for path in self.fixture_db_paths:
+            try:
+                os.remove(path)
+            except OSError as e:
+                self.logger.warning(f"Error removing {path}: {str(e)}")
 
 if __name__ == "__main__":
     with ContentBot() as bot:
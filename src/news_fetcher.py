@@ -1,12 +1,14 @@
 import logging
-from typing import List, Dict
+from typing import List, Dict, Optional
 import requests
 from datetime import datetime, timedelta
+from content_fetchers.http_client import HTTPClient
 
 class NewsFetcher:
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, http_client: Optional[HTTPClient] = None):
         """Initialize the news fetcher with configuration."""
         self.config = config
+        self.http_client = http_client or HTTPClient.shared()
         self.api_key = config.get('api_key')
         if not self.api_key:
             raise ValueError("NewsAPI key is required")
@@ -33,7 +35,7 @@ class NewsFetcher:
             }
             
             self.logger.info(f"Fetching articles about: {topics}")
-            response = requests.get(self.base_url, params=params)
+            response = self.http_client.get(self.base_url, params=params)
             response.raise_for_status()
             
             articles = response.json().get('articles', [])
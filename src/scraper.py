@@ -2,24 +2,115 @@ import requests
 from bs4 import BeautifulSoup
 from bs4 import Tag
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Iterator
+import json
 import re
-from urllib.parse import urljoin
-import time
-from random import randint, uniform
-from datetime import datetime
+from urllib.parse import urljoin, urlparse
+from datetime import datetime, timedelta, timezone
 import random
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from content_fetchers.http_cache import HTTPCache
+from content_fetchers.page_cache import PageCache
+from content_fetchers.http_client import HTTPClient
+from content_fetchers.html_parser import resolve_parser, container_strainer, parse_html
+from content_fetchers.extraction_plan import ExtractionPlan
+from content_fetchers.fetch_state import FetchState
+from content_fetchers.structured_data import extract_structured_data, html_to_text, normalize_date
+from content_fetchers.feed_downloader import fetch_feed
+from content_fetchers.sitemap import SitemapReader, parse_lastmod
+from content_fetchers.keyword_matcher import KeywordMatcher, normalize_keyword
+
+# Selectors for article containers on listing pages, tried in order
+ARTICLE_PATTERNS = [
+    'article',
+    '.post',
+    '.entry',
+    '.article',
+    '[class*="article"]',
+    '[class*="post"]',
+    '.story',
+    '.news-item',
+    '.card',
+    '.block',
+    '.item'
+]
+
+# Keywords that mark an article as on-topic when no shared matcher is passed in
+DEFAULT_KEYWORDS = ['ai', 'ml', 'artificial intelligence', 'machine learning', 'neural', 'deep learning']
+
+DOMAIN_PATTERN = re.compile(r'(?:https?://)?(?:www\.)?([^/]+)')
 
 class WebScraper:
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, http_client: Optional[HTTPClient] = None,
+                 keyword_matcher: Optional[KeywordMatcher] = None):
         self.config = config
         self.logger = logging.getLogger(__name__)
+        self.http_client = http_client or HTTPClient.shared()
+        
+        # Sources are scraped concurrently up to this limit; politeness is per host
+        self.max_concurrency = config.get('max_concurrency', 1)
+        
+        # Politeness: pace requests per host through the shared rate limiter
+        min_host_interval = config.get('min_host_interval', 3)
+        for source in config.get('sources', []):
+            host = urlparse(source).hostname
+            if host and min_host_interval:
+                self.http_client.rate_limiter.configure(host, rate=1.0 / min_host_interval)
         self.user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0',
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15',
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36 Edg/91.0.864.59'
         ]
+        
+        # Optionally revalidate listing pages with conditional GETs
+        self.http_cache = None
+        if config.get('conditional_get', False):
+            self.http_cache = HTTPCache(config.get('cache_path', 'http_cache.db'))
+        
+        # Optionally skip extraction for pages whose normalized content is unchanged
+        self.page_cache = None
+        if config.get('page_cache', False):
+            self.page_cache = PageCache(
+                config.get('cache_path', 'http_cache.db'),
+                ignore_patterns=config.get('page_cache_ignore', [])
+            )
+        
+        # HTML parsing backend; restricted parsing only builds article containers
+        self.parser = resolve_parser(config.get('parser', 'lxml'))
+        self.parse_only = None
+        if config.get('restricted_parse', False):
+            self.parse_only = container_strainer(ARTICLE_PATTERNS)
+        
+        # Read JSON-LD, OpenGraph and advertised feeds before the CSS heuristics
+        self.structured_data = config.get('structured_data', False)
+        
+        # Keyword and topic matchers are compiled once and reused for every article;
+        # the keyword matcher is normally the one built from filtering.keywords for ContentFilter
+        self.keyword_matcher = keyword_matcher or KeywordMatcher(config.get('keywords', DEFAULT_KEYWORDS))
+        self.topic_matchers = {}
+        
+        # Per-domain extraction plans; learned selector order is persisted if enabled
+        self.extraction_plans = {}
+        self.plans_lock = threading.Lock()
+        state_db_path = config.get('state_db_path', 'posts.db')
+        self.fetch_state = FetchState(state_db_path) if config.get('learn_selectors', False) else None
+        
+        # Sitemap discovery reads robots.txt and sitemaps instead of listing pages
+        self.discovery = config.get('discovery', 'html')
+        self.sitemap_reader = None
+        if self.discovery == 'sitemap':
+            self.sitemap_reader = SitemapReader(self.http_client, max_sitemaps=config.get('max_sitemaps', 5))
+            self.crawl_state = FetchState(state_db_path)
+            self.sitemap_lookback_days = config.get('sitemap_lookback_days', 2)
+            self.max_sitemap_articles = config.get('max_sitemap_articles', 20)
+            self.max_sitemap_page_fetches = config.get('max_sitemap_page_fetches', 0)
+        
+        # Optionally extract articles in worker processes, kept for the scraper's lifetime
+        self.extraction_workers = config.get('extraction_workers', 0)
+        self._extraction_pool = None
 
     def _get_random_headers(self):
         """Get random headers to avoid detection."""
@@ -32,38 +123,43 @@ class WebScraper:
             'Cache-Control': 'max-age=0'
         }
 
-    def _make_request(self, url: str, retries: int = 3) -> Optional[str]:
-        """Make HTTP request with retries and random delays."""
-        for attempt in range(retries):
-            try:
-                headers = self._get_random_headers()
-                response = requests.get(url, headers=headers, timeout=30)
-                response.raise_for_status()
-                return response.text
-            except requests.RequestException as e:
-                self.logger.error(f"Request failed for {url}: {str(e)}")
-                if attempt < retries - 1:
-                    delay = random.uniform(1, 3)
-                    time.sleep(delay)
-                    continue
-                return None
-            except Exception as e:
-                self.logger.error(f"Unexpected error for {url}: {str(e)}")
-                return None
-        return None
+    def _make_request(self, url: str, retries: int = 3, extra_headers: Optional[Dict] = None) -> Optional[requests.Response]:
+        """Make HTTP request over the shared client, which retries with jittered backoff."""
+        try:
+            headers = self._get_random_headers()
+            if extra_headers:
+                headers.update(extra_headers)
+            response = self.http_client.get(url, headers=headers, retries=retries - 1)
+            if response.status_code == 304:
+                return response
+            response.raise_for_status()
+            return response
+        except requests.RequestException as e:
+            self.logger.error(f"Request failed for {url}: {str(e)}")
+            return None
+        except Exception as e:
+            self.logger.error(f"Unexpected error for {url}: {str(e)}")
+            return None
 
     def scrape_content(self) -> List[Dict]:
-        articles = []
-        for source in self.config['sources']:
-            try:
-                logging.info(f"Scraping content from: {source}")
-                source_articles = self._scrape_source(source)
-                articles.extend(source_articles)
-                logging.info(f"Successfully scraped {len(source_articles)} articles from {source}")
-                # Add delay between requests
-                time.sleep(randint(2, 4))
-            except Exception as e:
-                logging.error(f"Error scraping {source}: {str(e)}")
+        """
+        Scrape every configured source.
+        
+        Sources are fetched concurrently up to ``max_concurrency``. The
+        shared rate limiter only spaces out requests to the same host, so
+        the wall time is bounded by the slowest host rather than the sum of
+        all of them.
+        """
+        sources = self.config['sources']
+        workers = max(1, min(self.max_concurrency, len(sources)))
+        self._get_extraction_pool()
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self._scrape_source_logged, sources))
+        else:
+            results = [self._scrape_source_logged(source) for source in sources]
+        
+        articles = [article for source_articles in results for article in source_articles]
         
         # Sort articles by relevance and limit
         articles = sorted(articles, key=lambda x: x.get('relevance_score', 0), reverse=True)
@@ -72,24 +168,144 @@ class WebScraper:
         logging.info(f"Total articles scraped: {len(articles)}")
         return articles
 
+    def iter_articles(self) -> Iterator[Dict]:
+        """Yield the scraped articles, so the scraper can run alongside the content fetchers."""
+        yield from self.scrape_content()
+
+    def _scrape_source_logged(self, source: str) -> List[Dict]:
+        """Scrape one source, logging instead of raising on failure."""
+        try:
+            logging.info(f"Scraping content from: {source}")
+            source_articles = self._scrape_source(source)
+            logging.info(f"Successfully scraped {len(source_articles)} articles from {source}")
+            return source_articles
+        except Exception as e:
+            logging.error(f"Error scraping {source}: {str(e)}")
+            return []
+
+    def _get_extraction_pool(self) -> Optional[ProcessPoolExecutor]:
+        """
+        Create the extraction process pool on first use.
+        
+        Workers are spawned rather than forked since the pool is usually
+        created on a fetcher thread while other threads hold locks.
+        """
+        if self.extraction_workers > 0 and self._extraction_pool is None:
+            worker_config = {
+                'parser': self.parser,
+                'restricted_parse': self.config.get('restricted_parse', False),
+                'structured_data': self.structured_data,
+                'nested_containers': self.config.get('nested_containers', 'outermost')
+            }
+            self._extraction_pool = ProcessPoolExecutor(
+                max_workers=self.extraction_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_extraction_worker,
+                initargs=(worker_config, self.keyword_matcher)
+            )
+        return self._extraction_pool
+
+    def close(self):
+        """Shut down the extraction worker processes."""
+        if self._extraction_pool:
+            self._extraction_pool.shutdown()
+            self._extraction_pool = None
+
+    def _extraction_plan(self, source_url: str) -> ExtractionPlan:
+        """Get the compiled extraction plan for a source's domain."""
+        domain = DOMAIN_PATTERN.search(source_url)
+        domain = domain.group(1) if domain else ''
+        
+        with self.plans_lock:
+            plan = self.extraction_plans.get(domain)
+            if plan is None:
+                saved = self.fetch_state.get(f"scraper:selectors:{domain}") if self.fetch_state else None
+                plan = ExtractionPlan.loads(domain, saved)
+                self.extraction_plans[domain] = plan
+            return plan
+
+    def _save_extraction_plan(self, plan: ExtractionPlan):
+        """Persist the selector order learned for a domain."""
+        if self.fetch_state and plan.dirty:
+            self.fetch_state.set(f"scraper:selectors:{plan.domain}", plan.dumps())
+
     def _scrape_source(self, source: str) -> List[Dict]:
         """Scrape articles from a source."""
         try:
             self.logger.info(f"Scraping content from: {source}")
+            if self.sitemap_reader:
+                articles = self._scrape_sitemaps(source)
+                if articles is not None:
+                    self.logger.info(f"Successfully scraped {len(articles)} articles from sitemaps of {source}")
+                    return articles
+                self.logger.info(f"No sitemap found for {source}, scraping the page instead")
+            
             self.logger.info(f"Making request to {source}")
             
-            html_content = self._make_request(source)
+            cache_headers = self.http_cache.conditional_headers(source) if self.http_cache else {}
+            response = self._make_request(source, extra_headers=cache_headers)
+            if response is None:
+                self.logger.error(f"Failed to retrieve content from {source}")
+                return []
+            
+            # Unchanged page: reuse the articles extracted last time
+            if response.status_code == 304:
+                cached_articles = self.http_cache.get_payload(source) if self.http_cache else None
+                if cached_articles is not None:
+                    self.logger.info(f"{source} not modified, using {len(cached_articles)} cached articles")
+                    return cached_articles
+                self.logger.error(f"{source} not modified but no cached articles found")
+                return []
+            
+            topics = self.config.get('topics', [])
+            
+            # Same content as last time: reuse the articles without building a soup
+            page_digest = None
+            if self.page_cache and response.content:
+                # Everything the extracted records and their relevance scores depend on
+                page_digest = self.page_cache.digest(
+                    response.content,
+                    topics + [
+                        self.structured_data,
+                        self.config.get('nested_containers', 'outermost'),
+                        '|'.join(self.keyword_matcher.keywords)
+                    ]
+                )
+                cached_articles = self.page_cache.get(source, page_digest)
+                if cached_articles is not None:
+                    self.logger.info(f"{source} content unchanged, using {len(cached_articles)} cached articles")
+                    return cached_articles
+            
+            html_content = response.text
             if not html_content:
                 self.logger.error(f"Failed to retrieve content from {source}")
                 return []
             
             self.logger.info(f"Successfully retrieved content from {source}")
-            soup = BeautifulSoup(html_content, 'html.parser')
             
-            articles = []
-            for topic in self.config.get('topics', []):
-                self.logger.info(f"Searching for articles about '{topic}' in {source}")
-                articles.extend(self._parse_articles(soup, source, topic))
+            self.logger.info(f"Searching for articles about {len(topics)} topics in {source}")
+            plan = self._extraction_plan(source)
+            page = response.content if self._get_extraction_pool() else html_content
+            articles, feeds = self._run_extraction(page, source, topics, plan, self.structured_data)
+            
+            self._save_extraction_plan(plan)
+            
+            # Nothing extractable on the page itself: read the feed it advertises for this section
+            feed_url = self._section_feed(feeds, source) if not articles else None
+            if feed_url:
+                articles = self._articles_from_feed(feed_url, source, topics)
+            
+            # Feed articles can change while the page stays the same, so only page extractions are cached
+            if page_digest and not feed_url:
+                self.page_cache.store(source, page_digest, articles)
+            
+            if self.http_cache and not feed_url:
+                self.http_cache.store(
+                    source,
+                    response.headers.get('ETag'),
+                    response.headers.get('Last-Modified'),
+                    articles
+                )
             
             self.logger.info(f"Successfully scraped {len(articles)} articles from {source}")
             return articles
@@ -97,35 +313,225 @@ class WebScraper:
         except Exception as e:
             self.logger.error(f"Error scraping {source}: {str(e)}")
             return []
-
-    def _parse_articles(self, soup: BeautifulSoup, source_url: str, topic: str) -> List[Dict]:
-        """Parse articles from HTML content."""
+    
+    def _scrape_sitemaps(self, source: str) -> Optional[List[Dict]]:
+        """
+        Collect articles added to the source's section since the last crawl.
+        
+        Only sitemap entries modified after the stored crawl time (or within
+        the lookback window on the first run) that belong to the source's
+        section are used. Article URLs rarely sit under a category or tag
+        page's path, so an entry belongs to it when its title, news
+        keywords or URL words match the keywords or scraping topics, or
+        when it is under the section's path. Entries from news sitemaps carry their title; other pages
+        are only fetched within ``max_sitemap_page_fetches``. The crawl time
+        advances once every usable entry has been read, and until then the
+        URLs already read are remembered so the next run continues after
+        them. Returns None if the page should be scraped instead: the site
+        has no sitemap, or none of its new entries can be read cheaply.
+        """
+        state_key = f"scraper:sitemap_crawl:{source}"
+        read_key = f"{state_key}:read"
+        state = self.crawl_state.get_many([state_key, read_key])
+        since = parse_lastmod(state.get(state_key))
+        if since is None:
+            since = datetime.now(timezone.utc) - timedelta(days=self.sitemap_lookback_days)
+        already_read = set(json.loads(state.get(read_key) or '[]'))
+        
+        headers = self._get_random_headers()
+        entries = self.sitemap_reader.new_entries(source, since, headers=headers)
+        if entries is None:
+            return None
+        if not entries:
+            return []
+        newest = max(entry['lastmod'] for entry in entries)
+        
+        # Sitemaps cover the whole site; a section source only wants its own stories
+        section = urlparse(source).path.rstrip('/')
+        if section:
+            entries = [entry for entry in entries if self._in_section(entry, section)]
+            if not entries:
+                self.logger.info(f"No new sitemap entries for {section} on {source}")
+                self.crawl_state.set_many({state_key: newest.isoformat(), read_key: '[]'})
+                return []
+        
+        # Newest first, one entry per URL, news entries before pages that have to be fetched
+        entries.sort(key=lambda entry: entry['lastmod'], reverse=True)
+        seen = set()
+        unique_entries = []
+        for entry in entries:
+            if entry['loc'] not in seen:
+                seen.add(entry['loc'])
+                unique_entries.append(entry)
+        titled = [entry for entry in unique_entries if entry['title'] and entry['loc'] not in already_read]
+        untitled = [entry for entry in unique_entries if not entry['title'] and entry['loc'] not in already_read]
+        if not titled and untitled and self.max_sitemap_page_fetches <= 0:
+            self.logger.info(f"Sitemap entries of {source} have no titles, scraping the page instead")
+            return None
+        
+        selected = titled[:self.max_sitemap_articles]
+        page_budget = min(self.max_sitemap_articles - len(selected), self.max_sitemap_page_fetches)
+        selected += untitled[:max(0, page_budget)]
+        
         articles = []
-        article_patterns = [
-            'article',
-            '.post',
-            '.entry',
-            '.article',
-            '[class*="article"]',
-            '[class*="post"]',
-            '.story',
-            '.news-item',
-            '.card',
-            '.block',
-            '.item'
-        ]
+        for entry in selected:
+            if entry['title']:
+                article = {'title': entry['title'], 'url': entry['loc'], 'content': '', 'summary': ''}
+            else:
+                article = self._article_from_page(entry['loc'], headers)
+            if article:
+                article['date'] = article.get('date') or entry['lastmod'].strftime('%Y-%m-%d')
+                articles.append(article)
+        
+        readable = len(titled) + (len(untitled) if self.max_sitemap_page_fetches > 0 else 0)
+        if len(selected) >= readable:
+            self.crawl_state.set_many({state_key: newest.isoformat(), read_key: '[]'})
+        else:
+            # Cut short by the caps: keep the crawl time so older entries are read next run
+            already_read.update(entry['loc'] for entry in selected)
+            self.crawl_state.set(read_key, json.dumps(sorted(already_read)))
+            self.logger.info(f"Read {len(selected)} of {readable} new sitemap entries of {source}, continuing next run")
+        
+        return self._label_articles(articles, source, self.config.get('topics', []))
+    
+    def _in_section(self, entry: Dict, section: str) -> bool:
+        """Whether a sitemap entry is on the topic of a section source."""
+        path = urlparse(entry['loc']).path
+        if path.startswith(section + '/'):
+            return True
+        text = ' '.join([entry['title'] or '', entry.get('keywords') or '', re.sub(r'[-_/]+', ' ', path)])
+        hits = self._find_keywords(text, '', self.config.get('topics', []))
+        return bool(hits['keywords'] or hits['topics'])
+    
+    def _article_from_page(self, url: str, headers: Optional[Dict] = None) -> Optional[Dict]:
+        """Read an article page found in a sitemap through its structured data."""
+        if not self.sitemap_reader.can_fetch(url, headers=headers):
+            self.logger.info(f"Skipping {url}, disallowed by robots.txt")
+            return None
+        
+        response = self._make_request(url)
+        if response is None or response.status_code != 200:
+            return None
         
-        for pattern in article_patterns:
+        data = extract_structured_data(response.content, url, self.parser)
+        return data['articles'][0] if data['articles'] else None
+    
+    def _run_extraction(self, html_content, source_url: str, topics: List[str], plan: ExtractionPlan,
+                        structured: bool) -> Tuple[List[Dict], List[str]]:
+        """Extract a page's articles, in a worker process if the extraction pool is enabled."""
+        extraction_pool = self._get_extraction_pool()
+        if extraction_pool:
+            # Raw bytes go to a worker process, which returns plain article records
+            articles, feeds, recorded = extraction_pool.submit(
+                extract_articles, html_content, source_url, topics, plan.domain, plan.state(), structured
+            ).result()
+            plan.merge(recorded)
+            return articles, feeds
+        return self._extract_page(html_content, source_url, topics, plan, structured)
+    
+    def _extract_page(self, html_content, source_url: str, topics: List[str], plan: ExtractionPlan,
+                      structured: bool = True) -> Tuple[List[Dict], List[str]]:
+        """
+        Extract articles from a page, returning them with any advertised feed URLs.
+        
+        Structured data listing other pages is used first. Structured data
+        that only describes the page itself, such as ``og:type=article`` on
+        every page of a site, doesn't count, and the CSS heuristics are used.
+        The feeds are returned so the caller can read one when the page
+        yields nothing.
+        """
+        feeds = []
+        if structured:
+            data = extract_structured_data(html_content, source_url, self.parser)
+            feeds = data['feeds']
+            page_url = source_url.rstrip('/')
+            listed = [article for article in data['articles'] if article['url'].rstrip('/') != page_url]
+            if listed:
+                self.logger.info(f"Found {len(listed)} articles in structured data on {source_url}")
+                return self._label_articles(listed, source_url, topics), feeds
+        
+        soup = parse_html(html_content, self.parser, self.parse_only)
+        return self._parse_articles(soup, source_url, topics, plan), feeds
+    
+    def _section_feed(self, feeds: List[str], source_url: str) -> Optional[str]:
+        """
+        Pick the advertised feed that covers the page's section.
+        
+        Sites usually advertise their site-wide feed on every page, so on a
+        section page like ``/category/ai/`` only a feed under that path is
+        used. Any feed of the site covers its front page.
+        """
+        page_path = urlparse(source_url).path.rstrip('/')
+        for feed_url in feeds:
+            feed_path = urlparse(feed_url).path
+            if not page_path or feed_path == page_path or feed_path.startswith(page_path + '/'):
+                return feed_url
+        if feeds:
+            self.logger.info(f"No feed advertised on {source_url} covers its section, skipping {len(feeds)} feeds")
+        return None
+    
+    def _articles_from_feed(self, feed_url: str, source_url: str, topics: List[str]) -> List[Dict]:
+        """Read the articles of a feed discovered on a source page."""
+        try:
+            feed = fetch_feed(feed_url, self.http_client)
+        except Exception as e:
+            self.logger.error(f"Error reading feed {feed_url}: {str(e)}")
+            return []
+        
+        articles = []
+        for entry in feed['entries']:
+            if not entry.get('title') or not entry.get('link'):
+                continue
+            summary = html_to_text(entry.get('summary', ''))
+            content = html_to_text(entry['content'][0].get('value', '')) if entry.get('content') else summary
+            articles.append({
+                'title': html_to_text(entry['title']),
+                'url': urljoin(feed_url, entry['link']),
+                'date': normalize_date(entry.get('published')),
+                'content': content,
+                'summary': summary
+            })
+        
+        self.logger.info(f"Found {len(articles)} articles in feed {feed_url}")
+        return self._label_articles(articles, source_url, topics)
+    
+    def _label_articles(self, articles: List[Dict], source_url: str, topics: List[str]) -> List[Dict]:
+        """Assign topics and source to extracted articles, as ``_parse_articles`` does."""
+        if not topics:
+            return []
+        for article in articles:
+            article['date'] = article.get('date') or datetime.now().strftime('%Y-%m-%d')
+            self._assign_topics(article, topics)
+            article['source'] = source_url
+        return articles
+
+    def _parse_articles(self, soup: BeautifulSoup, source_url: str, topics: List[str],
+                        plan: Optional[ExtractionPlan] = None) -> List[Dict]:
+        """
+        Parse articles from HTML content.
+        
+        Each container is extracted once and then scored against every
+        topic, so the page is walked once regardless of how many topics are
+        configured and each article is emitted once.
+        """
+        articles = []
+        plan = plan or self._extraction_plan(source_url)
+        for pattern in ARTICLE_PATTERNS:
             containers = soup.select(pattern)
             if containers:
                 self.logger.info(f"Found {len(containers)} containers with pattern '{pattern}'")
-                for container in containers:
+                seen_urls = set()
+                for container in self._collapse_nested(containers):
                     try:
-                        article = self._extract_article_info(container, source_url, topic)
-                        if article:
-                            article['topic'] = topic
-                            article['topic_hashtag'] = topic.replace(' ', '')
-                            article['relevance_score'] = self._calculate_relevance_score(article['title'], article['content'], topic)
+                        # Title and URL are cheap; skip the full extraction for repeated links
+                        link = self._extract_link(container, source_url, plan)
+                        if not link or link[1] in seen_urls:
+                            continue
+                        seen_urls.add(link[1])
+                        
+                        article = self._extract_article_info(container, source_url, plan, link)
+                        if article and topics:
+                            self._assign_topics(article, topics)
                             article['source'] = source_url
                             articles.append(article)
                     except Exception as e:
@@ -134,47 +540,88 @@ class WebScraper:
                 break  # Stop if we found articles with any pattern
         
         return articles
+    
+    def _collapse_nested(self, containers: List[Tag]) -> List[Tag]:
+        """
+        Reduce containers that are nested inside each other to one per article.
+        
+        A container whose nested matches link to two or more different pages
+        is a list wrapper and is dropped in favour of the matches inside it.
+        Of the remaining nested matches, the outermost one is kept by default
+        so the whole card is available for extraction, or the innermost one
+        that still has a link with ``nested_containers: innermost``.
+        """
+        matched = {id(container) for container in containers}
+        
+        # Nearest matched ancestor of each container, and the links of the matches each one wraps
+        parents = {}
+        nested_links = {}
+        for container in containers:
+            parent = container.parent
+            while parent is not None and id(parent) not in matched:
+                parent = parent.parent
+            if parent is not None:
+                parents[id(container)] = parent
+                link = container.find('a', href=True)
+                links = nested_links.setdefault(id(parent), set())
+                if link:
+                    links.add(link['href'])
+        
+        if self.config.get('nested_containers', 'outermost') == 'innermost':
+            collapsed = [container for container in containers if not nested_links.get(id(container))]
+        else:
+            kept = set()
+            collapsed = []
+            for container in containers:  # Document order, so ancestors are decided first
+                if len(nested_links.get(id(container), ())) >= 2:
+                    continue
+                ancestor = parents.get(id(container))
+                while ancestor is not None and id(ancestor) not in kept:
+                    ancestor = parents.get(id(ancestor))
+                if ancestor is None:
+                    kept.add(id(container))
+                    collapsed.append(container)
+        
+        if len(collapsed) < len(containers):
+            self.logger.info(f"Collapsed {len(containers)} nested containers to {len(collapsed)}")
+        return collapsed
 
-    def _extract_article_info(self, container, source_url: str, topic: str) -> Optional[Dict[str, str]]:
-        """Extract article information from a container."""
+    def _assign_topics(self, article: Dict, topics: List[str]):
+        """Score an extracted article against all topics and keep the best one.
+        
+        Every topic mentioned in the title or content is listed in
+        ``topics``, best first.
+        """
+        hits = self._find_keywords(article['title'], article['content'], topics)
+        scores = [
+            (self._calculate_relevance_score(article['title'], article['content'], topic, hits), topic)
+            for topic in topics
+        ]
+        best_score, best_topic = max(scores, key=lambda item: item[0])
+        
+        matched = [topic for score, topic in sorted(scores, key=lambda item: item[0], reverse=True)
+                   if normalize_keyword(topic) in hits['topics']]
+        
+        article['topic'] = best_topic
+        article['topic_hashtag'] = best_topic.replace(' ', '')
+        article['topics'] = matched or [best_topic]
+        article['relevance_score'] = best_score
+
+    def _extract_link(self, container, source_url: str, plan: ExtractionPlan) -> Optional[Tuple[str, str]]:
+        """Extract a container's title and absolute URL, the cheap part of extraction."""
         try:
-            # Site-specific patterns
-            site_specific_patterns = {
-                'theverge.com': {
-                    'title': ['h2', '.heading-standard', '.font-polysans', 'h2 a', '.article-title', '.c-entry-title'],
-                    'content': ['.duet--article--article-body-component', '.c-entry-content', '.article__body'],
-                    'summary': ['.duet--article--article-body-component p:first-child', '.c-entry-summary', '.article__summary']
-                },
-                'zdnet.com': {
-                    'title': ['h3', '.article__title', '.article-title', '.content-title'],
-                    'content': ['.article__body', '.article-content', '.content-body'],
-                    'summary': ['.article__summary', '.article-description', '.content-description']
-                }
-            }
-            
-            # Get domain-specific patterns
-            domain = re.search(r'(?:https?://)?(?:www\.)?([^/]+)', source_url)
-            domain = domain.group(1) if domain else ''
-            patterns = site_specific_patterns.get(domain, {})
-            
             # Extract title
             title = None
-            title_patterns = patterns.get('title', []) + [
-                'h1', 'h2', 'h3',  # Try any heading first
-                'h1 a', 'h2 a', 'h3 a',  # Then links within headings
-                'a',  # Then any link
-                '.title', '.headline', '.article-title'  # Finally, try classes
-            ]
-            
-            for pattern in title_patterns:
-                title_elems = container.select(pattern)
-                for title_elem in title_elems:
+            for pattern, selector in plan.ordered('title'):
+                for title_elem in selector.select(container):
                     potential_title = title_elem.get_text().strip()
                     if potential_title and len(potential_title) > 10:  # Ensure it's a substantial title
                         title = potential_title
                         break
                 if title:
+                    plan.record('title', pattern)
                     break
+                plan.miss('title', pattern)
             
             if not title:
                 return None
@@ -201,6 +648,22 @@ class WebScraper:
             if not url.startswith(('http://', 'https://')):
                 url = urljoin(source_url, url)
             
+            return title, url
+        
+        except Exception as e:
+            self.logger.error(f"Error extracting article link: {str(e)}")
+            return None
+    
+    def _extract_article_info(self, container, source_url: str, plan: Optional[ExtractionPlan] = None,
+                              link: Optional[Tuple[str, str]] = None) -> Optional[Dict[str, str]]:
+        """Extract article information from a container using the domain's extraction plan."""
+        try:
+            plan = plan or self._extraction_plan(source_url)
+            link = link or self._extract_link(container, source_url, plan)
+            if not link:
+                return None
+            title, url = link
+            
             # Extract date (use current date if not found)
             date = self._extract_date(container) or datetime.now().strftime('%Y-%m-%d')
             
@@ -208,53 +671,32 @@ class WebScraper:
             content = ""
             summary = ""
             
-            # Try site-specific patterns first
-            content_patterns = patterns.get('content', []) + [
-                '.article-content',
-                '.post-content',
-                '.entry-content',
-                '.content',
-                'article',
-                '.article-body',
-                '.post-body',
-                '.story-content'
-            ]
-            
-            summary_patterns = patterns.get('summary', []) + [
-                '.article-summary',
-                '.post-summary',
-                '.entry-summary',
-                '.excerpt',
-                '.description',
-                'meta[name="description"]',
-                'meta[property="og:description"]',
-                '.article-excerpt',
-                '.post-excerpt',
-                'article p:first-child'
-            ]
-            
             # Try to get content first
-            for pattern in content_patterns:
-                content_elem = container.select_one(pattern)
+            for pattern, selector in plan.ordered('content'):
+                content_elem = selector.select_one(container)
                 if content_elem:
                     content = content_elem.get_text().strip()
                     # Clean up the content
                     content = re.sub(r'\s+', ' ', content)  # Remove extra whitespace
                     content = content.replace('\n', ' ').strip()
+                    plan.record('content', pattern)
                     logging.info(f"Found content with pattern {pattern}: {content[:100]}...")
                     break
+                plan.miss('content', pattern)
             
             # Try to get summary
-            for pattern in summary_patterns:
-                summary_elem = container.select_one(pattern)
+            for pattern, selector in plan.ordered('summary'):
+                summary_elem = selector.select_one(container)
                 if summary_elem:
                     summary = summary_elem.get_text().strip()
                     # Clean up the summary
                     summary = re.sub(r'\s+', ' ', summary)  # Remove extra whitespace
                     summary = summary.replace('\n', ' ').strip()
                     if len(summary) > 50:  # Only use if it's a substantial summary
+                        plan.record('summary', pattern)
                         logging.info(f"Found summary with pattern {pattern}: {summary}")
                         break
+                plan.miss('summary', pattern)
             
             # If no content found, use any paragraph text
             if not content:
@@ -319,29 +761,40 @@ class WebScraper:
         
         return None
 
-    def _calculate_relevance_score(self, title: str, content: str, topic: str) -> float:
+    def _find_keywords(self, title: str, content: str, topics: List[str]) -> Dict:
+        """Find keywords and topics in an article's title and content, one pass per field."""
+        key = tuple(topics)
+        topic_matcher = self.topic_matchers.get(key)
+        if topic_matcher is None:
+            topic_matcher = self.topic_matchers[key] = KeywordMatcher(topics)
+        
+        title_keywords = self.keyword_matcher.find(title)
+        title_topics = topic_matcher.find(title)
+        return {
+            'keywords': title_keywords | self.keyword_matcher.find(content),
+            'title_keywords': title_keywords,
+            'topics': title_topics | topic_matcher.find(content),
+            'title_topics': title_topics
+        }
+    
+    def _calculate_relevance_score(self, title: str, content: str, topic: str, hits: Optional[Dict] = None) -> float:
         score = 0.0
-        text = (title + " " + content).lower()
+        hits = hits or self._find_keywords(title, content, [topic])
+        topic = normalize_keyword(topic)
         
         # Check for topic presence (30%)
-        if topic.lower() in text:
+        if topic in hits['topics']:
             score += 0.3
             
         # Check for required keywords (40%)
-        keyword_count = 0
-        required_keywords = ['ai', 'ml', 'artificial intelligence', 'machine learning', 'neural', 'deep learning']
-        for keyword in required_keywords:
-            if keyword.lower() in text:
-                keyword_count += 1
-        
+        keyword_count = len(hits['keywords'])
         if keyword_count > 0:
             score += 0.4 * min(1.0, keyword_count / 2)  # Only need 2 keywords for full score
         
         # Title specific boost (20%)
-        title_lower = title.lower()
-        if topic.lower() in title_lower:
+        if topic in hits['title_topics']:
             score += 0.2
-        elif any(k in title_lower for k in required_keywords):
+        elif hits['title_keywords']:
             score += 0.1
         
         # Length bonus (10%)
@@ -351,3 +804,27 @@ class WebScraper:
             score += 0.1
         
         return min(1.0, score)
+
+
+# Scraper built once in each extraction worker process and reused for every page
+_worker_scraper = None
+
+
+def _init_extraction_worker(config: Dict, keyword_matcher: Optional[KeywordMatcher] = None):
+    global _worker_scraper
+    _worker_scraper = WebScraper(config, keyword_matcher=keyword_matcher)
+
+
+def extract_articles(html_content: bytes, source_url: str, topics: List[str], domain: str,
+                     plan_state: Dict, structured: bool = True) -> Tuple[List[Dict], List[str], Dict]:
+    """
+    Parse a page and extract its articles in a worker process.
+    
+    The worker uses a copy of the domain's extraction plan and returns the
+    article records and advertised feeds together with the selector
+    successes it recorded, so the parent can merge them into its own plan.
+    """
+    scraper = _worker_scraper or WebScraper({})
+    plan = ExtractionPlan(domain, plan_state)
+    articles, feeds = scraper._extract_page(html_content, source_url, topics, plan, structured)
+    return articles, feeds, plan.recorded
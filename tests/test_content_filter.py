@@ -0,0 +1,66 @@
+import pytest
+
+pytest.importorskip('scipy')
+
+from content_filter import ContentFilter
+
+
+def make_config(batch_scoring: bool) -> dict:
+    return {
+        'filtering': {
+            'min_relevance_score': 1.0,
+            'max_articles': 3,
+            'keywords': ['AI', 'machine learning'],
+            'batch_scoring': {'enabled': batch_scoring},
+        }
+    }
+
+
+def on_topic_articles(count: int) -> list:
+    return [
+        {
+            'url': f'https://example.com/story-{index}',
+            'title': f'Story {index}: AI and machine learning',
+            'summary': 'How AI teams ship machine learning models.',
+            'content': '',
+        }
+        for index in range(count)
+    ]
+
+
+def test_batch_scoring_passes_articles_that_all_share_the_keywords(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    flat = ContentFilter(make_config(batch_scoring=False)).filter_article_stream(on_topic_articles(40))
+    batch = ContentFilter(make_config(batch_scoring=True)).filter_article_stream(on_topic_articles(40))
+
+    assert len(flat) == 3
+    assert len(batch) == 3
+
+
+def test_batch_scoring_drops_articles_below_the_flat_floor(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    articles = on_topic_articles(2) + [
+        {'url': 'https://example.com/off-topic', 'title': 'Quarterly earnings', 'summary': 'Revenue grew.', 'content': ''}
+    ]
+
+    results = ContentFilter(make_config(batch_scoring=True)).filter_article_stream(articles)
+
+    assert [article['url'] for article in results] == [
+        'https://example.com/story-0', 'https://example.com/story-1'
+    ]
+
+
+def test_richest_copy_of_a_story_is_kept_whichever_arrives_first(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = make_config(batch_scoring=False)
+    config['filtering']['near_duplicates'] = {'enabled': True, 'threshold': 0.6}
+    story = 'Lab releases open machine learning model for AI research on protein folding'
+    thin = {'url': 'https://aggregator.example.com/1', 'title': story, 'summary': 'AI', 'content': ''}
+    rich = {
+        'url': 'https://publisher.example.com/story', 'title': story, 'summary': 'AI',
+        'content': 'The machine learning model and its AI training data are published in full.'
+    }
+
+    results = ContentFilter(config).filter_article_stream([thin, rich])
+
+    assert [article['url'] for article in results] == ['https://publisher.example.com/story']
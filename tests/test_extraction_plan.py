@@ -0,0 +1,25 @@
+from content_fetchers.extraction_plan import ExtractionPlan, MIN_MISSES_TO_SKIP, REPROBE_EVERY_RUNS
+
+
+def patterns(plan: ExtractionPlan, field: str) -> list:
+    return [pattern for pattern, _ in plan.ordered(field)]
+
+
+def test_dropped_selectors_are_tried_again_every_few_runs():
+    plan = ExtractionPlan.loads('example.com', None)
+    for _ in range(MIN_MISSES_TO_SKIP):
+        plan.miss('title', 'h1')
+    assert 'h1' not in patterns(plan, 'title')
+
+    saved = plan.dumps()
+    for _ in range(REPROBE_EVERY_RUNS - 2):
+        plan = ExtractionPlan.loads('example.com', saved)
+        assert 'h1' not in patterns(plan, 'title')
+        saved = plan.dumps()
+
+    plan = ExtractionPlan.loads('example.com', saved)
+    assert 'h1' in patterns(plan, 'title')
+
+    plan.record('title', 'h1')
+    plan = ExtractionPlan.loads('example.com', plan.dumps())
+    assert 'h1' in patterns(plan, 'title')
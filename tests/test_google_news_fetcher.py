@@ -0,0 +1,28 @@
+from content_fetchers import GoogleNewsFetcher
+
+
+def entry(story: str) -> dict:
+    return {'id': story, 'title': f'Story {story}', 'link': f'https://example.com/{story}'}
+
+
+def test_articles_stream_topic_by_topic_and_merge_later_topics():
+    fetcher = GoogleNewsFetcher({'sources': {'google_news': {'topics': ['AI', 'machine learning']}}})
+    downloaded = []
+
+    def topic_feeds():
+        downloaded.append('AI')
+        yield 'AI', {'entries': [entry('one'), entry('two')]}
+        downloaded.append('machine learning')
+        yield 'machine learning', {'entries': [entry('two'), entry('three')]}
+
+    fetcher._iter_topic_feeds = topic_feeds
+    articles = fetcher.iter_articles()
+
+    first = next(articles)
+    assert downloaded == ['AI']
+    rest = list(articles)
+
+    assert [article['url'] for article in [first] + rest] == [
+        'https://example.com/one', 'https://example.com/two', 'https://example.com/three'
+    ]
+    assert rest[0]['topics'] == ['AI', 'machine learning']
@@ -0,0 +1,23 @@
+import requests
+
+from content_fetchers import HTTPClient
+
+
+def test_recording_asks_for_full_responses_and_saves_them(tmp_path, monkeypatch):
+    client = HTTPClient({'fixtures': {'mode': 'record', 'path': str(tmp_path / 'fixtures')}})
+    sent = []
+
+    def request(method, url, **kwargs):
+        sent.append(kwargs.get('headers'))
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'<rss></rss>'
+        return response
+
+    monkeypatch.setattr(client.session, 'request', request)
+    client.get('https://example.com/feed', headers={'If-None-Match': '"v1"', 'Accept': 'application/rss+xml'})
+
+    assert sent == [{'Accept': 'application/rss+xml'}]
+
+    replay = HTTPClient({'fixtures': {'mode': 'replay', 'path': str(tmp_path / 'fixtures')}})
+    assert replay.get('https://example.com/feed').content == b'<rss></rss>'
@@ -0,0 +1,150 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+from content_fetchers import NewsAPIFetcher
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, data: dict = None):
+        self.status_code = status_code
+        self.data = data or {}
+
+    def json(self) -> dict:
+        return self.data
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class FakeNewsAPI:
+    """Serves ``articles`` newest first, honouring from/to, page and pageSize like NewsAPI."""
+
+    def __init__(self, articles: list):
+        self.articles = sorted(articles, key=lambda article: article['publishedAt'], reverse=True)
+        self.requests = []
+
+    def get(self, url: str, params: dict = None, **kwargs) -> FakeResponse:
+        self.requests.append(dict(params))
+        matching = [
+            article for article in self.articles
+            if article['publishedAt'] >= params['from']
+            and ('to' not in params or article['publishedAt'] <= params['to'])
+        ]
+        start = (params['page'] - 1) * params['pageSize']
+        return FakeResponse(200, {
+            'totalResults': len(matching),
+            'articles': matching[start:start + params['pageSize']]
+        })
+
+
+def days_ago(days: float) -> str:
+    moment = datetime.now(timezone.utc).replace(microsecond=0) - timedelta(days=days)
+    return moment.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def article(url: str, published_at: str) -> dict:
+    return {'url': url, 'title': url, 'publishedAt': published_at, 'source': {'name': 'Test'}}
+
+
+NOW = days_ago(1)
+GAP_FROM = days_ago(5)
+GAP_MIDDLE = days_ago(4.5)
+GAP_TO = days_ago(4)
+BEFORE_GAP_TO = days_ago(4 + 1 / 86400)
+
+
+def make_fetcher(tmp_path, http_client, max_pages: int = 1, max_articles: int = 2) -> NewsAPIFetcher:
+    config = {
+        'state': {'db_path': str(tmp_path / 'state.db')},
+        'sources': {'news_api': {
+            'api_key': 'test', 'incremental': True, 'max_pages': max_pages, 'max_articles': max_articles
+        }}
+    }
+    return NewsAPIFetcher(config, http_client)
+
+
+def stored_gaps(fetcher: NewsAPIFetcher) -> list:
+    return json.loads(fetcher.fetch_state.get(fetcher.gaps_key) or '[]')
+
+
+def test_gaps_get_a_page_when_the_latest_articles_use_the_whole_budget(tmp_path):
+    client = FakeNewsAPI([])
+    fetcher = make_fetcher(tmp_path, client, max_pages=1)
+    fetcher.fetch_state.set_many({
+        fetcher.watermark_key: NOW,
+        fetcher.gaps_key: json.dumps([{
+            'from': GAP_FROM, 'from_urls': [], 'to': GAP_TO, 'to_urls': []
+        }])
+    })
+    client.articles = [article('https://example.com/gap', GAP_MIDDLE)]
+
+    urls = [item['url'] for item in fetcher.iter_articles()]
+
+    assert urls == ['https://example.com/gap']
+    assert stored_gaps(fetcher) == []
+
+
+def test_gap_whose_page_only_repeats_boundary_articles_moves_past_them(tmp_path):
+    client = FakeNewsAPI([
+        article('https://example.com/b1', GAP_TO),
+        article('https://example.com/b2', GAP_TO),
+        article('https://example.com/older', GAP_MIDDLE),
+    ])
+    fetcher = make_fetcher(tmp_path, client, max_pages=1)
+    fetcher.fetch_state.set_many({
+        fetcher.watermark_key: NOW,
+        fetcher.gaps_key: json.dumps([{
+            'from': GAP_FROM, 'from_urls': [],
+            'to': GAP_TO, 'to_urls': ['https://example.com/b1', 'https://example.com/b2']
+        }])
+    })
+
+    assert list(fetcher.iter_articles()) == []
+    assert stored_gaps(fetcher) == [{
+        'from': GAP_FROM, 'from_urls': [], 'to': BEFORE_GAP_TO, 'to_urls': []
+    }]
+
+    urls = [item['url'] for item in fetcher.iter_articles()]
+
+    assert urls == ['https://example.com/older']
+    assert stored_gaps(fetcher) == []
+
+
+class RejectingNewsAPI:
+    def __init__(self):
+        self.requests = []
+
+    def get(self, url: str, params: dict = None, **kwargs) -> FakeResponse:
+        self.requests.append(dict(params))
+        return FakeResponse(426, {'status': 'error', 'code': 'parameterInvalid'})
+
+
+def test_ranges_older_than_the_plan_history_are_clamped(tmp_path):
+    client = FakeNewsAPI([])
+    fetcher = make_fetcher(tmp_path, client)
+    fetcher.fetch_state.set_many({
+        fetcher.watermark_key: '2020-01-02T00:00:00Z',
+        fetcher.gaps_key: json.dumps([{
+            'from': '2019-12-01T00:00:00Z', 'from_urls': [], 'to': '2019-12-02T00:00:00Z', 'to_urls': []
+        }])
+    })
+
+    list(fetcher.iter_articles())
+
+    assert len(client.requests) == 1
+    assert client.requests[0]['from'] > '2020-01-02T00:00:00Z'
+    assert stored_gaps(fetcher) == []
+
+
+def test_rejected_first_page_resets_the_watermark(tmp_path):
+    client = RejectingNewsAPI()
+    fetcher = make_fetcher(tmp_path, client)
+    fetcher.fetch_state.set(fetcher.watermark_key, '2099-01-01T00:00:00Z')
+
+    assert list(fetcher.iter_articles()) == []
+    assert fetcher.fetch_state.get(fetcher.watermark_key) == ''
+
+    list(fetcher.iter_articles())
+
+    assert client.requests[-1]['from'] < '2099-01-01'
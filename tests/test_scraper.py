@@ -0,0 +1,106 @@
+from datetime import datetime, timezone
+
+from scraper import WebScraper
+
+NESTED_PAGE = b"""
+<html><body>
+  <article>
+    <p>Outer card teaser that wraps the story below.</p>
+    <article>
+      <h2><a href="/story">Machine learning models get faster</a></h2>
+      <p>Inner story text about machine learning.</p>
+    </article>
+  </article>
+</body></html>
+"""
+
+
+def extract_nested(extraction_workers: int) -> list:
+    scraper = WebScraper({
+        'topics': ['machine learning'],
+        'parser': 'html.parser',
+        'nested_containers': 'innermost',
+        'extraction_workers': extraction_workers,
+    })
+    try:
+        source = 'https://example.com/ai/'
+        plan = scraper._extraction_plan(source)
+        articles, _ = scraper._run_extraction(NESTED_PAGE, source, ['machine learning'], plan, False)
+        return articles
+    finally:
+        scraper.close()
+
+
+def test_innermost_nested_containers_apply_in_the_extraction_pool():
+    in_process = extract_nested(extraction_workers=0)
+    pooled = extract_nested(extraction_workers=1)
+
+    assert [article['content'] for article in pooled] == [article['content'] for article in in_process]
+    assert 'Outer card teaser' not in pooled[0]['content']
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, content: bytes = b''):
+        self.status_code = status_code
+        self.content = content
+        self.text = content.decode('utf-8')
+
+    def iter_content(self, chunk_size: int):
+        yield self.content
+
+    def close(self):
+        pass
+
+
+class FakeSite:
+    def __init__(self, pages: dict):
+        self.pages = pages
+
+    def get(self, url: str, **kwargs) -> FakeResponse:
+        if url in self.pages:
+            return FakeResponse(200, self.pages[url])
+        return FakeResponse(404)
+
+
+def news_entry(url: str, title: str, keywords: str, published: str) -> str:
+    return f"""
+  <url>
+    <loc>{url}</loc>
+    <news:news>
+      <news:publication_date>{published}</news:publication_date>
+      <news:title>{title}</news:title>
+      <news:keywords>{keywords}</news:keywords>
+    </news:news>
+  </url>"""
+
+
+def test_sitemap_discovery_keeps_on_topic_stories_of_a_category_source(tmp_path):
+    published = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    sitemap = (
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" '
+        'xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">'
+        + news_entry('https://techcrunch.com/2026/10/15/openai-ships-a-faster-model/',
+                     'OpenAI ships a faster model', 'Artificial Intelligence, OpenAI', published)
+        + news_entry('https://techcrunch.com/2026/10/15/new-gpu-speeds-up-machine-learning/',
+                     'New GPU speeds up training', 'Hardware', published)
+        + news_entry('https://techcrunch.com/2026/10/15/apple-reports-earnings/',
+                     'Apple reports quarterly earnings', 'Apple, Earnings', published)
+        + '</urlset>'
+    )
+    site = FakeSite({
+        'https://techcrunch.com/robots.txt': b'Sitemap: https://techcrunch.com/news-sitemap.xml\n',
+        'https://techcrunch.com/news-sitemap.xml': sitemap.encode('utf-8'),
+    })
+    scraper = WebScraper({
+        'topics': ['artificial intelligence', 'machine learning'],
+        'keywords': ['AI', 'machine learning'],
+        'discovery': 'sitemap',
+        'state_db_path': str(tmp_path / 'state.db'),
+    }, http_client=site)
+
+    articles = scraper._scrape_sitemaps('https://techcrunch.com/category/artificial-intelligence/')
+
+    assert sorted(article['url'] for article in articles) == [
+        'https://techcrunch.com/2026/10/15/new-gpu-speeds-up-machine-learning/',
+        'https://techcrunch.com/2026/10/15/openai-ships-a-faster-model/',
+    ]
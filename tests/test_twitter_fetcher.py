@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import requests
+
+tweepy = pytest.importorskip('tweepy')
+
+from content_fetchers.twitter_fetcher import TWITTER_EPOCH_MS, TwitterFetcher
+
+
+def tweet_id(age: timedelta) -> str:
+    created_ms = int((datetime.now(timezone.utc) - age).timestamp() * 1000)
+    return str((created_ms - TWITTER_EPOCH_MS) << 22)
+
+
+class FakeClient:
+    def __init__(self, reject_since_id: bool = False):
+        self.reject_since_id = reject_since_id
+        self.since_ids = []
+
+    def search_recent_tweets(self, since_id=None, **kwargs):
+        self.since_ids.append(since_id)
+        if since_id and self.reject_since_id:
+            response = requests.Response()
+            response.status_code = 400
+            raise tweepy.BadRequest(response)
+        return None
+
+
+def make_fetcher(tmp_path, client: FakeClient) -> TwitterFetcher:
+    fetcher = TwitterFetcher({
+        'bearer_token': 'test', 'search_queries': ['#AI'], 'state_db_path': str(tmp_path / 'state.db')
+    })
+    fetcher.client = client
+    return fetcher
+
+
+def test_cursor_older_than_the_search_window_is_left_out(tmp_path):
+    client = FakeClient()
+    fetcher = make_fetcher(tmp_path, client)
+    fetcher.fetch_state.set('twitter:since_id:query:#AI', tweet_id(timedelta(days=8)))
+
+    list(fetcher.iter_articles())
+
+    assert client.since_ids == [None]
+
+
+def test_rejected_cursor_is_cleared_and_the_search_repeated(tmp_path):
+    client = FakeClient(reject_since_id=True)
+    fetcher = make_fetcher(tmp_path, client)
+    cursor = tweet_id(timedelta(days=1))
+    fetcher.fetch_state.set('twitter:since_id:query:#AI', cursor)
+
+    list(fetcher.iter_articles())
+
+    assert client.since_ids == [cursor, None]
+    assert fetcher.fetch_state.get('twitter:since_id:query:#AI') == ''